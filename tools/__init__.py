@@ -35,6 +35,7 @@ from .worktree_manager import (
 from .memo_scanner import (
     Memo,
     MemoScanner,
+    MemoStatus,
     scan_ready_to_consume,
 )
 
@@ -67,6 +68,7 @@ __all__ = [
     # Memos
     'Memo',
     'MemoScanner',
+    'MemoStatus',
     'scan_ready_to_consume',
     # Integration
     'IntegrationResult',
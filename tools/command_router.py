@@ -356,6 +356,7 @@ def handle_start_workflow(cmd: ParsedCommand, ctx: dict) -> CommandResult:
 
     # Optionally create worktrees (one per role for this iteration)
     created_worktrees: list[str] = []
+    worktree_errors: list[str] = []
     if bool(worktrees_cfg.get("enabled", True)):
         trunk_branch = project_cfg.get("trunk_branch") or ctx.get("trunk_branch") or "main"
         branch_prefix = worktrees_cfg.get("branch_prefix") or "feat"
@@ -373,13 +374,15 @@ def handle_start_workflow(cmd: ParsedCommand, ctx: dict) -> CommandResult:
 
         manager = WorktreeManager(repo_root, worktree_base=worktree_base)
         roles = sorted({(a.get("role") or "unknown") for a in iteration_config["agents"]})
-        for role in roles:
-            try:
-                wt = manager.create_worktree(role=role, task_name=iteration_id, base_branch=trunk_branch, branch_prefix=branch_prefix)
-                created_worktrees.append(str(wt.path))
-            except Exception:
-                # If it already exists or git isn't available, don't fail the whole workflow generation.
-                continue
+        specs = [(role, iteration_id, trunk_branch, branch_prefix) for role in roles]
+        try:
+            # Roles whose worktree already exists are skipped; other failed adds are reported.
+            worktrees = manager.create_worktrees_batch(specs, skip_existing=True, errors=worktree_errors)
+        except Exception as e:
+            # If git isn't available, don't fail the whole workflow generation.
+            worktrees = []
+            worktree_errors.append(str(e))
+        created_worktrees.extend(str(wt.path) for wt in worktrees)
 
     # Cursor CLI `agent` commands (optional)
     # This is the core "Cursor-agent orchestrates via CLI" loop:
@@ -480,6 +483,7 @@ def handle_start_workflow(cmd: ParsedCommand, ctx: dict) -> CommandResult:
             "task_count": len(task_cards),
             "dispatch_memo": str(dispatch_memo_path),
             "worktrees_created": created_worktrees,
+            "worktree_errors": worktree_errors,
             "cursor_opened": opened_in_cursor,
             "cursor_agent_commands": agent_commands,
         },
@@ -932,6 +936,7 @@ def handle_ingest_project(cmd: ParsedCommand, ctx: dict) -> CommandResult:
         message="Project ingestion complete" + (" (dry-run)" if dry_run else ""),
         data={
             "dry_run": dry_run,
+            "unchanged": result.unchanged,
             "scope": result.profile.get("scope"),
             "profile_path": str(result.profile_path),
             "context_path": str(result.context_path),
@@ -1205,6 +1210,7 @@ def handle_sync_work_items(cmd: ParsedCommand, ctx: dict) -> CommandResult:
                 "written": res.written,
                 "updated": res.updated,
                 "skipped": res.skipped,
+                "not_modified": res.not_modified,
                 "errors": res.errors,
             },
         )
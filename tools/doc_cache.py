@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import stat
+from pathlib import Path
+
+# path -> (st_mtime_ns, st_size, max_chars read, text read)
+_CACHE: dict[Path, tuple[int, int, int, str]] = {}
+
+
+def get_doc(path: Path, max_chars: int = 200_000) -> str | None:
+    """
+    Read a (possibly truncated) text document, reusing earlier reads.
+
+    Iteration docs such as `CONTEXT.md` are read by both the evaluator and the
+    knowledge manager. Reads are cached per path and revalidated with a single
+    `stat()` (mtime + size), so a repeat request for an unchanged file costs no
+    read. A cached read also serves any request with a smaller `max_chars`.
+
+    Returns None if the file is missing, not a regular file, or unreadable.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    cached = _CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size and cached[2] >= max_chars:
+        text = cached[3]
+    else:
+        try:
+            with path.open(encoding="utf-8", errors="replace") as f:
+                text = f.read(max_chars + 1)
+        except Exception:
+            return None
+        _CACHE[path] = (st.st_mtime_ns, st.st_size, max_chars, text)
+
+    if len(text) > max_chars:
+        return text[:max_chars] + "\n\n[TRUNCATED]\n"
+    return text
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -27,12 +28,15 @@ def load_dotenv(path: Path, *, override: bool = False) -> DotenvLoadResult:
     - Does NOT override existing environment variables unless override=True.
     """
     path = Path(path)
-    if not path.exists() or not path.is_file():
+    try:
+        text = path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        # Missing file, directory, or unreadable: nothing to load.
         return DotenvLoadResult(loaded=False, path=path, keys_set=[])
 
     keys_set: list[str] = []
     try:
-        for raw in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        for raw in text.splitlines():
             line = raw.strip()
             if not line or line.startswith("#"):
                 continue
@@ -69,8 +73,11 @@ def find_dotenv(start: Path, *, filename: str = ".env", max_depth: int = 8) -> P
     current = start
     for _ in range(max_depth + 1):
         candidate = current / filename
-        if candidate.exists() and candidate.is_file():
-            return candidate
+        try:
+            if stat.S_ISREG(candidate.stat().st_mode):
+                return candidate
+        except OSError:
+            pass
         if current.parent == current:
             break
         current = current.parent
@@ -7,7 +7,11 @@ Implements the apply-ready workflow for converging agent work.
 
 from __future__ import annotations
 
+import os
+import re
+import stat
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +39,9 @@ class IntegrationResult:
 class IntegrationManager:
     """Manages integration of agent work into target branch."""
     
+    # Memo status line, e.g. "- **Status**: `ready-to-consume`"
+    STATUS_PATTERN = re.compile(r'(\*\*Status\*\*:\s*)`?([^`\n]+)`?', re.IGNORECASE)
+    
     def __init__(
         self,
         repo_root: Path,
@@ -73,7 +80,7 @@ class IntegrationManager:
             IntegrationResult with summary of operations
         """
         # Scan for ready-to-consume memos
-        ready_memos = self.memo_scanner.scan_ready_to_consume()
+        ready_memos = list(self.memo_scanner.scan_ready_to_consume())
         
         if not ready_memos:
             return IntegrationResult(
@@ -89,39 +96,21 @@ class IntegrationManager:
         merged_branches = []
         failed_branches = []
         skipped_memos = []
+        buckets = {
+            'merged': merged_branches,
+            'failed': failed_branches,
+            'skipped': skipped_memos,
+        }
+        
+        # Every merge lands on the same target branch, so merges are applied
+        # one after another; only the checkout is shared across all of them.
+        if not dry_run and any(m.branch for m in ready_memos):
+            self._ensure_target_branch()
+            self._pull_target_branch()
         
         for memo in ready_memos:
-            if not memo.branch:
-                print(f"  WARN Skipping {memo.path.name}: No branch specified")
-                skipped_memos.append(str(memo.path.name))
-                continue
-            
-            print(f"\n  Processing: {memo.path.name}")
-            print(f"    Branch: {memo.branch}")
-            print(f"    SHA: {memo.sha or 'unknown'}")
-            
-            if dry_run:
-                print(f"    [DRY RUN] Would merge {memo.branch}")
-                merged_branches.append(memo.branch)
-                continue
-            
-            # Attempt merge
-            try:
-                self._merge_branch(memo.branch, memo)
-                merged_branches.append(memo.branch)
-                print("    OK Merged successfully")
-                
-                # Update memo status
-                # Align with documented memo lifecycle: ready-to-consume -> ready-to-merge
-                self._update_memo_status(memo, 'ready-to-merge')
-                
-            except Exception as e:
-                print(f"    ERR Merge failed: {e}")
-                failed_branches.append(memo.branch)
-                
-                # Update memo status
-                # Use documented status values; attach error detail.
-                self._update_memo_status(memo, 'blocked', str(e))
+            outcome, name = self._process_one(memo, dry_run=dry_run)
+            buckets[outcome].append(name)
         
         # Summary
         success = len(failed_branches) == 0
@@ -135,6 +124,47 @@ class IntegrationManager:
             skipped_memos=skipped_memos
         )
     
+    def _process_one(self, memo: Memo, dry_run: bool = False) -> tuple[str, str]:
+        """
+        Integrate a single ready-to-consume memo.
+        
+        Args:
+            memo: Memo to process
+            dry_run: If True, only report what would be merged
+            
+        Returns:
+            Tuple of (outcome, name) where outcome is 'merged', 'failed' or 'skipped'
+        """
+        if not memo.branch:
+            print(f"  WARN Skipping {memo.path.name}: No branch specified")
+            return 'skipped', str(memo.path.name)
+        
+        print(f"\n  Processing: {memo.path.name}")
+        print(f"    Branch: {memo.branch}")
+        print(f"    SHA: {memo.sha or 'unknown'}")
+        
+        if dry_run:
+            print(f"    [DRY RUN] Would merge {memo.branch}")
+            return 'merged', memo.branch
+        
+        # Attempt merge
+        try:
+            self._merge_branch(memo.branch, memo)
+            print("    OK Merged successfully")
+            
+            # Update memo status
+            # Align with documented memo lifecycle: ready-to-consume -> ready-to-merge
+            self._update_memo_status(memo, 'ready-to-merge')
+            return 'merged', memo.branch
+            
+        except Exception as e:
+            print(f"    ERR Merge failed: {e}")
+            
+            # Update memo status
+            # Use documented status values; attach error detail.
+            self._update_memo_status(memo, 'blocked', str(e))
+            return 'failed', memo.branch
+    
     def _merge_branch(self, branch: str, memo: Memo) -> None:
         """
         Merge a branch into target branch.
@@ -143,12 +173,24 @@ class IntegrationManager:
             branch: Branch name to merge
             memo: Memo associated with the branch
             
+        The target branch must already be checked out and pulled (see
+        `apply_ready`); merges themselves only use local refs.
+        
         Raises:
             subprocess.CalledProcessError: If merge fails
         """
-        self._ensure_target_branch()
+        # Merge the branch
+        commit_message = f"feat: integrate {memo.work_item or branch}\n\nFrom: {memo.role or 'agent'}\nMemo: {memo.path.name}"
         
-        # Pull latest changes (if remote exists)
+        subprocess.run(
+            ['git', 'merge', '--no-ff', '-m', commit_message, branch],
+            cwd=self.repo_root,
+            check=True,
+            capture_output=True
+        )
+
+    def _pull_target_branch(self) -> None:
+        """Pull latest changes for the target branch once per run (if remote exists)."""
         try:
             subprocess.run(
                 ['git', 'pull', 'origin', self.target_branch],
@@ -159,17 +201,7 @@ class IntegrationManager:
         except subprocess.CalledProcessError:
             # No remote or other error - skip pull
             pass
-        
-        # Merge the branch
-        commit_message = f"feat: integrate {memo.work_item or branch}\n\nFrom: {memo.role or 'agent'}\nMemo: {memo.path.name}"
-        
-        subprocess.run(
-            ['git', 'merge', '--no-ff', '-m', commit_message, branch],
-            cwd=self.repo_root,
-            check=True,
-            capture_output=True
-        )
-
+    
     def _ensure_target_branch(self) -> None:
         """
         Ensure the target branch exists locally and is checked out.
@@ -230,29 +262,54 @@ class IntegrationManager:
         try:
             content = memo.path.read_text(encoding='utf-8')
             
-            # Update status line
-            import re
-            pattern = re.compile(r'(\*\*Status\*\*:\s*)`?([^`\n]+)`?', re.IGNORECASE)
+            # Already recorded by an earlier run: leave the file untouched
+            if not error_message and '**Integrated**:' in content:
+                match = self.STATUS_PATTERN.search(content)
+                if match and match.group(2).strip(' `').lower() == new_status.lower():
+                    return
             
+            # Update status line
             if error_message:
                 replacement = f'\\1`{new_status}` - {error_message}'
             else:
                 replacement = f'\\1`{new_status}`'
             
-            updated_content = pattern.sub(replacement, content)
+            updated_content = self.STATUS_PATTERN.sub(replacement, content)
             
-            # Add integration timestamp
+            # Add integration timestamp (always fresh, so never already present)
             timestamp = datetime.now().isoformat()
-            integration_note = f"\n\n**Integrated**: {timestamp}\n"
+            updated_content += f"\n\n**Integrated**: {timestamp}\n"
             
-            if integration_note not in updated_content:
-                updated_content += integration_note
-            
-            memo.path.write_text(updated_content, encoding='utf-8')
+            self._write_atomic(memo.path, updated_content)
+            self.memo_scanner.invalidate()
             
         except Exception as e:
             print(f"    Warning: Failed to update memo status: {e}")
     
+    @staticmethod
+    def _write_atomic(path: Path, content: str) -> None:
+        """
+        Replace a file's content atomically.
+        
+        Writes to a temp file in the same directory and renames it over the
+        original, so a crash never leaves a truncated memo behind.
+        """
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.memo-', suffix='.tmp')
+        try:
+            try:
+                os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+            except OSError:
+                pass
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    
     def list_ready_work(self) -> list[Memo]:
         """
         List all ready-to-consume work.
@@ -260,11 +317,15 @@ class IntegrationManager:
         Returns:
             List of ready-to-consume Memo objects
         """
-        return self.memo_scanner.scan_ready_to_consume()
+        return list(self.memo_scanner.scan_ready_to_consume())
     
     def check_merge_conflicts(self, branch: str) -> tuple[bool, str]:
         """
-        Check if merging a branch would cause conflicts.
+        Check if merging a branch into the target branch would cause conflicts.
+        
+        Uses `git merge-tree --write-tree` (git >= 2.38), which computes the
+        merge without touching HEAD, the index or the working tree. Older git
+        falls back to a test merge that is aborted afterwards.
         
         Args:
             branch: Branch name to check
@@ -273,28 +334,47 @@ class IntegrationManager:
             Tuple of (has_conflicts, message)
         """
         try:
-            # Use git merge with --no-commit and --no-ff to test merge
             result = subprocess.run(
-                ['git', 'merge', '--no-commit', '--no-ff', branch],
+                ['git', 'merge-tree', '--write-tree', '--name-only', self.target_branch, branch],
                 cwd=self.repo_root,
                 capture_output=True,
                 text=True
             )
             
-            # Abort the test merge
-            subprocess.run(
-                ['git', 'merge', '--abort'],
-                cwd=self.repo_root,
-                capture_output=True
-            )
+            if result.returncode == 0:
+                return False, "No conflicts detected"
+            if result.returncode == 1:
+                # Conflicts: stdout lists the tree, conflicted files and messages;
+                # errors such as unknown refs are reported on stderr instead.
+                return True, result.stdout or result.stderr
             
-            if result.returncode != 0:
-                return True, result.stderr
-            
-            return False, "No conflicts detected"
+            # merge-tree --write-tree unsupported (usage error); use a test merge.
+            return self._check_merge_conflicts_legacy(branch)
             
         except Exception as e:
             return True, str(e)
+    
+    def _check_merge_conflicts_legacy(self, branch: str) -> tuple[bool, str]:
+        """Test-merge `branch` into the current checkout, then abort it."""
+        # Use git merge with --no-commit and --no-ff to test merge
+        result = subprocess.run(
+            ['git', 'merge', '--no-commit', '--no-ff', branch],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True
+        )
+        
+        # Abort the test merge
+        subprocess.run(
+            ['git', 'merge', '--abort'],
+            cwd=self.repo_root,
+            capture_output=True
+        )
+        
+        if result.returncode != 0:
+            return True, result.stderr
+        
+        return False, "No conflicts detected"
 
 
 if __name__ == "__main__":
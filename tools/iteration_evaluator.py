@@ -1,11 +1,30 @@
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from .doc_cache import get_doc
+    from .memo_scanner import MemoScanner
+except ImportError:
+    from doc_cache import get_doc
+    from memo_scanner import MemoScanner
+
+_EXCERPT_CHARS = 2000
+_MEMO_HEADER_CHARS = 4096
+_TASK_LINK_RE = re.compile(r"\]\(([^)]+\.md)\)")
+# Below this many task cards, they are checked serially.
+_PARALLEL_READ_MIN = 8
+
+# Sections every generated task card is expected to contain.
+_REQUIRED_CARD_SECTIONS = ("- **Role**:", "- **Work Item**:", "## Steps", "## Deliverables", "## Command to Start")
+_REQUIRED_CARD_SECTIONS_RE = re.compile("|".join(re.escape(s) for s in _REQUIRED_CARD_SECTIONS))
+
 
 @dataclass(frozen=True)
 class EvaluationResult:
@@ -19,7 +38,9 @@ def _read_text(path: Path, max_chars: int = 200_000) -> str | None:
     try:
         if not path.exists() or not path.is_file():
             return None
-        text = path.read_text(encoding="utf-8", errors="replace")
+        # Read at most one char past the limit so large files are truncated at read time.
+        with path.open(encoding="utf-8", errors="replace") as f:
+            text = f.read(max_chars + 1)
         if len(text) > max_chars:
             return text[:max_chars] + "\n\n[TRUNCATED]\n"
         return text
@@ -27,9 +48,22 @@ def _read_text(path: Path, max_chars: int = 200_000) -> str | None:
         return None
 
 
+def _card_missing_sections(card_path: Path) -> bool:
+    card = _read_text(card_path) or ""
+    if not card:
+        return True
+    found = set(_REQUIRED_CARD_SECTIONS_RE.findall(card))
+    return len(found) < len(_REQUIRED_CARD_SECTIONS)
+
+
 def _latest_index_for_iteration(tasks_dir: Path, iteration: str) -> Path | None:
-    cands = sorted(tasks_dir.glob(f"*_{iteration}_INDEX.md"))
-    return cands[-1] if cands else None
+    suffix = f"_{iteration}_INDEX.md"
+    try:
+        with os.scandir(tasks_dir) as it:
+            cands = sorted(e.name for e in it if e.name.endswith(suffix) and not e.name.startswith("."))
+    except OSError:
+        return None
+    return tasks_dir / cands[-1] if cands else None
 
 
 def evaluate_iteration(
@@ -57,15 +91,17 @@ def evaluate_iteration(
     agent_sync_dir = repo_root / (coordination_cfg.get("agent_sync_dir") or ".orchestration/runtime/agent-sync")
 
     evals_dir = repo_root / (knowledge_cfg.get("evaluations_dir") or ".orchestration/knowledge/evaluations")
-    evals_dir.mkdir(parents=True, exist_ok=True)
 
-    stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    # One clock read per evaluation: the filename stamp and report header agree.
+    now = datetime.now(timezone.utc)
+    stamp = now.strftime("%Y%m%d-%H%M%S")
     out_path = evals_dir / f"{iteration}_{stamp}.md"
 
     suggestions: list[str] = []
 
-    ctx = _read_text(it_dir / "CONTEXT.md") or ""
-    crit = _read_text(it_dir / "COMPLETION_CRITERIA.md") or ""
+    # Only the report excerpt is ever used, so bound the reads to it.
+    ctx = get_doc(it_dir / "CONTEXT.md", max_chars=_EXCERPT_CHARS) or ""
+    crit = get_doc(it_dir / "COMPLETION_CRITERIA.md", max_chars=_EXCERPT_CHARS) or ""
 
     if not it_dir.exists():
         suggestions.append("Iteration directory not found; ensure `/orchestrator::start_workflow` ran successfully.")
@@ -80,34 +116,30 @@ def evaluate_iteration(
     else:
         idx_text = _read_text(idx) or ""
         # Count task links
-        links = re.findall(r"\]\(([^)]+\.md)\)", idx_text)
+        links = _TASK_LINK_RE.findall(idx_text)
         task_links = [l for l in links if not l.endswith("_INDEX.md")]
         if len(task_links) == 0:
             suggestions.append("Task index has no linked task cards; task index formatting may need adjustment.")
 
-        # Quick quality checks on task cards
-        missing_sections = 0
-        for fname in task_links[:30]:
-            card_path = tasks_dir / fname
-            card = _read_text(card_path) or ""
-            if not card:
-                missing_sections += 1
-                continue
-            for must in ("- **Role**:", "- **Work Item**:", "## Steps", "## Deliverables", "## Command to Start"):
-                if must not in card:
-                    missing_sections += 1
-                    break
+        # Quick quality checks on task cards (independent reads, so overlap them)
+        card_paths = [tasks_dir / fname for fname in task_links[:30]]
+        if len(card_paths) < _PARALLEL_READ_MIN:
+            missing_sections = sum(_card_missing_sections(p) for p in card_paths)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(card_paths))) as ex:
+                missing_sections = sum(ex.map(_card_missing_sections, card_paths))
         if missing_sections:
             suggestions.append("Some task cards are missing expected sections; consider tightening task card template and validation.")
 
     # Memo hygiene checks
-    try:
-        from .memo_scanner import MemoScanner
-    except ImportError:
-        from memo_scanner import MemoScanner
     memos = MemoScanner(agent_sync_dir).scan_all()
-    iteration_related = [m for m in memos if iteration in m.path.name or iteration in (_read_text(m.path) or "")]
-    if not iteration_related:
+    # Only the memo header is searched: iteration refs live there, and the
+    # filename check (no I/O) short-circuits most matches.
+    has_iteration_memo = any(
+        iteration in m.path.name or iteration in (_read_text(m.path, max_chars=_MEMO_HEADER_CHARS) or "")
+        for m in memos
+    )
+    if not has_iteration_memo:
         suggestions.append("No iteration-related memos detected; consider ensuring dispatch memo includes the iteration name and that agents post completion memos.")
 
     # Prompt/rules suggestions (concrete)
@@ -120,7 +152,7 @@ def evaluate_iteration(
 
     report = []
     report.append(f"# Iteration Evaluation: {iteration}\n")
-    report.append(f"- **Generated at**: {datetime.utcnow().isoformat()}Z")
+    report.append(f"- **Generated at**: {now.replace(tzinfo=None).isoformat()}Z")
     report.append(f"- **Iteration dir**: `{it_dir.as_posix()}`")
     report.append(f"- **Tasks dir**: `{tasks_dir.as_posix()}`")
     report.append(f"- **Agent sync dir**: `{agent_sync_dir.as_posix()}`\n")
@@ -133,14 +165,15 @@ def evaluate_iteration(
         report.append("- No obvious issues detected by heuristics.\n")
 
     report.append("\n## Context (excerpt)\n")
-    report.append((ctx[:2000] + ("\n\n[TRUNCATED]\n" if len(ctx) > 2000 else "")) or "_No CONTEXT.md found._")
+    report.append(ctx or "_No CONTEXT.md found._")
 
     report.append("\n## Completion Criteria (excerpt)\n")
-    report.append((crit[:2000] + ("\n\n[TRUNCATED]\n" if len(crit) > 2000 else "")) or "_No COMPLETION_CRITERIA.md found._")
+    report.append(crit or "_No COMPLETION_CRITERIA.md found._")
 
     report.append("\n" + "\n".join(concrete))
 
     if not dry_run:
+        evals_dir.mkdir(parents=True, exist_ok=True)
         out_path.write_text("\n".join(report) + "\n", encoding="utf-8")
 
     return EvaluationResult(
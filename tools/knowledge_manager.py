@@ -1,10 +1,24 @@
 from __future__ import annotations
 
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from .doc_cache import get_doc
+    from .memo_scanner import MemoScanner, MemoStatus
+except ImportError:
+    from doc_cache import get_doc
+    from memo_scanner import MemoScanner, MemoStatus
+
+_EXCERPT_CHARS = 4000
+# Below this many iterations, their summaries are built serially.
+_PARALLEL_READ_MIN = 8
+
 
 @dataclass(frozen=True)
 class KnowledgeUpdateResult:
@@ -18,7 +32,9 @@ def _read_text(path: Path, max_chars: int = 200_000) -> str | None:
     try:
         if not path.exists() or not path.is_file():
             return None
-        text = path.read_text(encoding="utf-8", errors="replace")
+        # Read at most one char past the limit so large files are truncated at read time.
+        with path.open(encoding="utf-8", errors="replace") as f:
+            text = f.read(max_chars + 1)
         if len(text) > max_chars:
             return text[:max_chars] + "\n\n[TRUNCATED]\n"
         return text
@@ -32,7 +48,9 @@ def _safe_dump_yaml(data: dict[str, Any]) -> str:
     except Exception:
         # Fallback: crude repr (still readable, but not ideal)
         return repr(data) + "\n"
-    return yaml.safe_dump(data, sort_keys=False)
+    # Prefer the libyaml-backed dumper when PyYAML was built with it.
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, Dumper=dumper, sort_keys=False)
 
 
 def update_knowledge_base(
@@ -58,29 +76,18 @@ def update_knowledge_base(
     iterations_dir = repo_root / (orchestration_cfg.get("iterations_dir") or ".orchestration/runtime/iterations")
 
     written: list[str] = []
-    now = datetime.utcnow().isoformat() + "Z"
+    now = datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
 
     # Build memo summary using MemoScanner
-    try:
-        from .memo_scanner import MemoScanner
-    except ImportError:
-        from memo_scanner import MemoScanner
     scanner = MemoScanner(agent_sync_dir)
-    memos = scanner.scan_all()
+    memos = list(scanner.scan_all())
 
     counts = {"draft": 0, "ready-to-consume": 0, "ready-to-merge": 0, "blocked": 0, "other": 0}
     for m in memos:
-        s = (m.status or "").lower()
-        if "ready-to-consume" in s:
-            counts["ready-to-consume"] += 1
-        elif "ready-to-merge" in s:
-            counts["ready-to-merge"] += 1
-        elif "blocked" in s:
-            counts["blocked"] += 1
-        elif "draft" in s:
-            counts["draft"] += 1
-        else:
+        if m.status_norm is MemoStatus.UNKNOWN:
             counts["other"] += 1
+        else:
+            counts[m.status_norm.label] += 1
 
     readme = []
     readme.append("# Knowledgebase\n")
@@ -112,39 +119,49 @@ def update_knowledge_base(
         if p.exists():
             target_iterations = [p]
     else:
-        if iterations_dir.exists():
-            target_iterations = [p for p in sorted(iterations_dir.iterdir()) if p.is_dir()]
-
-    iter_summaries: dict[str, str] = {}
-    for it_dir in target_iterations:
-        it_name = it_dir.name
-        ctx_md = _read_text(it_dir / "CONTEXT.md") or ""
-        crit_md = _read_text(it_dir / "COMPLETION_CRITERIA.md") or ""
+        try:
+            with os.scandir(iterations_dir) as it:
+                target_iterations = sorted(Path(e.path) for e in it if e.is_dir())
+        except OSError:
+            pass
+
+    def _summarize(it_dir: Path) -> bytes:
+        ctx_md = get_doc(it_dir / "CONTEXT.md", max_chars=_EXCERPT_CHARS) or ""
+        crit_md = get_doc(it_dir / "COMPLETION_CRITERIA.md", max_chars=_EXCERPT_CHARS) or ""
         summary = []
-        summary.append(f"# Iteration Summary: {it_name}\n")
+        summary.append(f"# Iteration Summary: {it_dir.name}\n")
         summary.append(f"- **Generated at**: {now}")
         summary.append(f"- **Iteration dir**: `{it_dir.as_posix()}`\n")
         if ctx_md:
             summary.append("## Context (excerpt)\n")
-            summary.append(ctx_md[:4000] + ("\n\n[TRUNCATED]\n" if len(ctx_md) > 4000 else ""))
+            summary.append(ctx_md)
         if crit_md:
             summary.append("\n## Completion Criteria (excerpt)\n")
-            summary.append(crit_md[:4000] + ("\n\n[TRUNCATED]\n" if len(crit_md) > 4000 else ""))
-        iter_summaries[it_name] = "\n".join(summary) + "\n"
+            summary.append(crit_md)
+        return ("\n".join(summary) + "\n").encode("utf-8")
+
+    # Output files and their pre-encoded UTF-8 bodies, in write order.
+    outputs: list[tuple[Path, bytes]] = [
+        (knowledge_dir / "README.md", ("\n".join(readme) + "\n").encode("utf-8")),
+        (knowledge_dir / "memos_summary.md", ("\n".join(memos_md) + "\n").encode("utf-8")),
+    ]
 
     if not dry_run:
+        # Each iteration reads its own files, so overlap the reads. Summaries are
+        # only ever written out, so a dry run skips them.
+        if len(target_iterations) < _PARALLEL_READ_MIN:
+            bodies = [_summarize(it_dir) for it_dir in target_iterations]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(target_iterations))) as ex:
+                bodies = list(ex.map(_summarize, target_iterations))
+        for it_dir, body in zip(target_iterations, bodies):
+            outputs.append((kb_iters_dir / f"{it_dir.name}.md", body))
+
         knowledge_dir.mkdir(parents=True, exist_ok=True)
         kb_iters_dir.mkdir(parents=True, exist_ok=True)
 
-        (knowledge_dir / "README.md").write_text("\n".join(readme) + "\n", encoding="utf-8")
-        written.append(str((knowledge_dir / "README.md").relative_to(repo_root)))
-
-        (knowledge_dir / "memos_summary.md").write_text("\n".join(memos_md) + "\n", encoding="utf-8")
-        written.append(str((knowledge_dir / "memos_summary.md").relative_to(repo_root)))
-
-        for it_name, content in iter_summaries.items():
-            out_path = kb_iters_dir / f"{it_name}.md"
-            out_path.write_text(content, encoding="utf-8")
+        for out_path, body in outputs:
+            out_path.write_bytes(body)
             written.append(str(out_path.relative_to(repo_root)))
 
         # Snapshot key config signals into knowledgebase for convenience (optional).
@@ -153,7 +170,7 @@ def update_knowledge_base(
             src = cfg_dir / p
             if src.exists():
                 kb_copy = knowledge_dir / f"config_snapshot_{p}"
-                kb_copy.write_text(_read_text(src) or "", encoding="utf-8")
+                shutil.copyfile(src, kb_copy)
                 written.append(str(kb_copy.relative_to(repo_root)))
 
     return KnowledgeUpdateResult(
@@ -7,14 +7,60 @@ Scans agent-sync/ directory for coordination memos and extracts metadata.
 
 from __future__ import annotations
 
+import codecs
+import os
 import re
-from dataclasses import dataclass
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
-@dataclass
+# Parsed scans keyed by agent-sync dir: (per-file stat fingerprint, status index).
+_SCAN_CACHE: dict[Path, tuple[tuple, dict[str, list["Memo"]]]] = {}
+
+
+class MemoStatus(IntEnum):
+    """Memo lifecycle status, normalized once at parse time."""
+    UNKNOWN = 0
+    DRAFT = 1
+    READY_TO_CONSUME = 2
+    READY_TO_MERGE = 3
+    BLOCKED = 4
+    
+    @property
+    def label(self) -> str:
+        """Status as written in memos (e.g. 'ready-to-consume')."""
+        return self.name.lower().replace('_', '-')
+    
+    @classmethod
+    def from_text(cls, status: str) -> MemoStatus:
+        """
+        Normalize a free-form status value.
+        
+        Matching is by substring, so annotated values such as
+        "`blocked` - merge failed" still resolve. When several labels
+        appear, the earlier lifecycle stage in _STATUS_PRECEDENCE wins.
+        """
+        lowered = status.lower()
+        for member in _STATUS_PRECEDENCE:
+            if member.label in lowered:
+                return member
+        return cls.UNKNOWN
+
+
+_STATUS_PRECEDENCE = (
+    MemoStatus.READY_TO_CONSUME,
+    MemoStatus.READY_TO_MERGE,
+    MemoStatus.BLOCKED,
+    MemoStatus.DRAFT,
+)
+
+
+@dataclass(slots=True)
 class Memo:
     """Represents a coordination memo."""
     path: Path
@@ -26,39 +72,55 @@ class Memo:
     role: Optional[str]
     work_item: Optional[str]
     deliverables: list[str]
+    status_norm: MemoStatus = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.status_norm = MemoStatus.from_text(self.status)
     
     @property
     def is_ready_to_consume(self) -> bool:
         """Check if memo status is ready-to-consume."""
-        return 'ready-to-consume' in self.status.lower()
+        return self.status_norm is MemoStatus.READY_TO_CONSUME
     
     @property
     def is_ready_to_merge(self) -> bool:
         """Check if memo status is ready-to-merge."""
-        return 'ready-to-merge' in self.status.lower()
+        return self.status_norm is MemoStatus.READY_TO_MERGE
     
     @property
     def is_blocked(self) -> bool:
         """Check if memo status is blocked."""
-        return 'blocked' in self.status.lower()
+        return self.status_norm is MemoStatus.BLOCKED
     
     @property
     def is_draft(self) -> bool:
         """Check if memo status is draft."""
-        return 'draft' in self.status.lower()
+        return self.status_norm is MemoStatus.DRAFT
 
 
 class MemoScanner:
     """Scans and parses coordination memos."""
     
-    # Regex patterns for parsing memo headers
-    DATE_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*Date\*\*:\s*([^\n]+)', re.IGNORECASE)
-    AUDIENCE_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*Audience\*\*:\s*([^\n]+)', re.IGNORECASE)
-    STATUS_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*Status\*\*:\s*`?([^`\n]+)`?', re.IGNORECASE)
-    BRANCH_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*Branch\*\*:\s*`?([^`\n]+)`?', re.IGNORECASE)
-    SHA_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*SHA\*\*:\s*`?([0-9a-f]{6,40})`?', re.IGNORECASE)
-    WORK_ITEM_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*Work Item\*\*:\s*([^\n]+)', re.IGNORECASE)
-    DELIVERABLES_PATTERN = re.compile(r'(?:^|\n)\s*-?\s*\*\*Deliverables\*\*:\s*\n((?:\s*-\s*[^\n]+\n?)*)', re.IGNORECASE)
+    # Metadata lines ("- **Key**: value"); one pass over the header finds them all
+    HEADER_PATTERN = re.compile(
+        r'^[ \t]*-?[ \t]*\*\*(Date|Audience|Status|Branch|SHA|Work Item|Deliverables)\*\*:[ \t]*([^\n]*)',
+        re.IGNORECASE | re.MULTILINE,
+    )
+    SHA_VALUE_PATTERN = re.compile(r'`?([0-9a-f]{6,40})', re.IGNORECASE)
+    AUDIENCE_TOKEN_RE = re.compile(r'@([\w-]+)')
+    
+    # Framework docs that live alongside memos but are not memos
+    SKIP_FILES = frozenset({'COMMAND_SHORTHAND.md', 'COMMUNICATION_CONVENTIONS.md',
+                            'WORKTREE_OPERATING_MODEL.md', 'README.md'})
+    
+    # Read size for memo headers; most headers fit in the first block
+    HEADER_READ_BYTES = 8192
+    
+    # Below this many memos, parse serially (pool start-up would dominate)
+    PARALLEL_PARSE_MIN = 8
+    
+    # Buckets of the per-directory status index
+    INDEX_KEYS = ('all', 'ready-to-consume', 'ready-to-merge', 'blocked', 'draft')
     
     def __init__(self, agent_sync_dir: Path):
         """
@@ -69,58 +131,168 @@ class MemoScanner:
         """
         self.agent_sync_dir = Path(agent_sync_dir)
     
-    def scan_all(self) -> list[Memo]:
+    def scan_all(self) -> Iterator[Memo]:
         """
         Scan all memos in agent-sync directory.
         
         Returns:
-            List of Memo objects
+            Iterator over Memo objects
+        """
+        return iter(self._build_index()['all'])
+    
+    def _build_index(self) -> dict[str, list[Memo]]:
+        """
+        Parse every memo once and bucket them by status.
+        
+        The index holds 'all' plus one list per status; it is reused while
+        no memo was added, removed or modified.
+        
+        Returns:
+            Dict mapping 'all' / status name to Memo lists
         """
-        if not self.agent_sync_dir.exists():
-            return []
-        
-        memos = []
-        for memo_path in sorted(self.agent_sync_dir.glob('*.md')):
-            # Skip certain files
-            if memo_path.name in ('COMMAND_SHORTHAND.md', 'COMMUNICATION_CONVENTIONS.md', 
-                                  'WORKTREE_OPERATING_MODEL.md', 'README.md'):
+        # Filter on the name before touching the file; skip files are never opened
+        try:
+            with os.scandir(self.agent_sync_dir) as it:
+                entries = sorted(
+                    (e for e in it
+                     if e.name.endswith('.md') and not e.name.startswith('.')
+                     and e.name not in self.SKIP_FILES and e.is_file()),
+                    key=lambda e: e.name,
+                )
+        except OSError:
+            return {key: [] for key in self.INDEX_KEYS}
+        
+        fingerprint = tuple(self._stat_key(e) for e in entries)
+        cached = _SCAN_CACHE.get(self.agent_sync_dir)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        index: dict[str, list[Memo]] = {key: [] for key in self.INDEX_KEYS}
+        memo_paths = [self.agent_sync_dir / e.name for e in entries]
+        if len(memo_paths) < self.PARALLEL_PARSE_MIN:
+            parsed = [self.parse_memo(p) for p in memo_paths]
+        else:
+            # File reads dominate; overlap them across a small thread pool
+            with ThreadPoolExecutor(max_workers=min(32, len(memo_paths))) as ex:
+                parsed = list(ex.map(self.parse_memo, memo_paths))
+        
+        for memo in parsed:
+            if not memo:
                 continue
-            
-            memo = self.parse_memo(memo_path)
-            if memo:
-                memos.append(memo)
+            index['all'].append(memo)
+            if memo.status_norm is not MemoStatus.UNKNOWN:
+                index[memo.status_norm.label].append(memo)
         
-        return memos
+        _SCAN_CACHE[self.agent_sync_dir] = (fingerprint, index)
+        return index
+    
+    def invalidate(self) -> None:
+        """Drop cached scan results for this agent-sync directory."""
+        _SCAN_CACHE.pop(self.agent_sync_dir, None)
+    
+    @staticmethod
+    def _stat_key(entry: os.DirEntry) -> tuple:
+        """Cheap change-detection key for a memo file."""
+        try:
+            st = entry.stat()
+        except OSError:
+            return (entry.name, None, None)
+        return (entry.name, st.st_mtime_ns, st.st_size)
     
-    def scan_ready_to_consume(self) -> list[Memo]:
+    def scan_ready_to_consume(self) -> Iterator[Memo]:
         """
         Scan for memos with ready-to-consume status.
         
         Returns:
-            List of Memo objects with ready-to-consume status
+            Iterator over Memo objects with ready-to-consume status
         """
-        all_memos = self.scan_all()
-        return [m for m in all_memos if m.is_ready_to_consume]
+        return iter(self._build_index()['ready-to-consume'])
     
-    def scan_ready_to_merge(self) -> list[Memo]:
+    def scan_ready_to_merge(self) -> Iterator[Memo]:
         """
         Scan for memos with ready-to-merge status.
         
         Returns:
-            List of Memo objects with ready-to-merge status
+            Iterator over Memo objects with ready-to-merge status
         """
-        all_memos = self.scan_all()
-        return [m for m in all_memos if m.is_ready_to_merge]
+        return iter(self._build_index()['ready-to-merge'])
     
-    def scan_blocked(self) -> list[Memo]:
+    def scan_blocked(self) -> Iterator[Memo]:
         """
         Scan for memos with blocked status.
         
         Returns:
-            List of Memo objects with blocked status
+            Iterator over Memo objects with blocked status
+        """
+        return iter(self._build_index()['blocked'])
+    
+    @classmethod
+    def _read_header(cls, memo_path: Path) -> str:
+        """
+        Read the memo header: everything before the first `## ` section.
+        
+        Metadata bullets (Date, Status, Branch, ...) precede the body
+        sections, so the file is read in fixed-size blocks only until the
+        first section heading shows up; typical memos need a single read.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        text = ''
+        with memo_path.open('rb') as f:
+            while True:
+                block = f.read(cls.HEADER_READ_BYTES)
+                search_from = max(len(text) - 3, 0)
+                text += decoder.decode(block, final=not block)
+                cut = text.find('\n## ', search_from)
+                if cut != -1:
+                    text = text[:cut + 1]
+                    break
+                if not block:
+                    break
+        return text.replace('\r\n', '\n')
+    
+    @staticmethod
+    def _unquote(value: str) -> str:
+        """Return the first backtick-delimited token (or the bare value)."""
+        if value.startswith('`'):
+            value = value[1:]
+        return value.split('`', 1)[0].strip()
+    
+    @staticmethod
+    def _parse_deliverables(content: str, pos: int) -> list[str]:
+        """
+        Collect the `- item` lines that follow a `**Deliverables**:` line.
+        
+        Walks `content` line by line from `pos` (start of the next line):
+        blank lines are skipped and the first non-bullet line ends the list.
         """
-        all_memos = self.scan_all()
-        return [m for m in all_memos if m.is_blocked]
+        deliverables = []
+        end = len(content)
+        while pos < end:
+            eol = content.find('\n', pos)
+            if eol == -1:
+                eol = end
+            line = content[pos:eol].strip()
+            pos = eol + 1
+            if not line:
+                continue
+            if not line.startswith('-'):
+                break
+            deliverable = line.lstrip('- ').strip()
+            if deliverable:
+                deliverables.append(deliverable)
+        return deliverables
+    
+    @staticmethod
+    def _parse_date(date_str: str) -> Optional[datetime]:
+        """Parse a memo date; plain YYYY-MM-DD (the usual form) skips fromisoformat."""
+        try:
+            if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+                    and date_str.isascii() and date_str[:4].isdigit()
+                    and date_str[5:7].isdigit() and date_str[8:].isdigit()):
+                return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            return None
     
     def parse_memo(self, memo_path: Path) -> Optional[Memo]:
         """
@@ -133,63 +305,55 @@ class MemoScanner:
             Memo object if successfully parsed, None otherwise
         """
         try:
-            content = memo_path.read_text(encoding='utf-8')
+            content = self._read_header(memo_path)
         except Exception:
             return None
         
-        # Extract metadata using regex
-        date_match = self.DATE_PATTERN.search(content)
-        audience_match = self.AUDIENCE_PATTERN.search(content)
-        status_match = self.STATUS_PATTERN.search(content)
-        branch_match = self.BRANCH_PATTERN.search(content)
-        sha_match = self.SHA_PATTERN.search(content)
-        work_item_match = self.WORK_ITEM_PATTERN.search(content)
-        deliverables_match = self.DELIVERABLES_PATTERN.search(content)
+        # Extract metadata; the first usable occurrence of each key wins
+        fields: dict[str, str] = {}
+        deliverables = None
+        for match in self.HEADER_PATTERN.finditer(content):
+            key = match.group(1).lower()
+            value = match.group(2).strip()
+            if key == 'deliverables':
+                if deliverables is None and not value and match.end() < len(content):
+                    deliverables = self._parse_deliverables(content, match.end() + 1)
+                continue
+            if key in fields:
+                continue
+            if key in ('status', 'branch'):
+                value = self._unquote(value)
+            elif key == 'sha':
+                sha_match = self.SHA_VALUE_PATTERN.match(value)
+                value = sha_match.group(1) if sha_match else ''
+            if value:
+                fields[key] = value
         
         # Parse date
-        date = None
-        if date_match:
-            date_str = date_match.group(1).strip()
-            try:
-                date = datetime.fromisoformat(date_str)
-            except ValueError:
-                pass
+        date = self._parse_date(fields['date']) if 'date' in fields else None
         
         # Parse audience (extract @role tags)
         audience = []
-        if audience_match:
-            audience_str = audience_match.group(1)
+        if 'audience' in fields:
             # Find all @role tags
-            audience = re.findall(r'@([\w-]+)', audience_str)
+            audience = [sys.intern(a) for a in self.AUDIENCE_TOKEN_RE.findall(fields['audience'])]
         
-        # Parse status
-        status = status_match.group(1).strip() if status_match else 'unknown'
+        # Parse status (status, role and audience values repeat across memos; share them)
+        status = sys.intern(fields.get('status', 'unknown'))
         
         # Parse branch and SHA
-        branch = branch_match.group(1).strip() if branch_match else None
-        sha = sha_match.group(1).strip() if sha_match else None
+        branch = fields.get('branch')
+        sha = fields.get('sha')
         
         # Parse work item
-        work_item = work_item_match.group(1).strip() if work_item_match else None
-        
-        # Parse deliverables
-        deliverables = []
-        if deliverables_match:
-            deliverables_text = deliverables_match.group(1)
-            # Extract each deliverable line
-            for line in deliverables_text.split('\n'):
-                line = line.strip()
-                if line.startswith('-'):
-                    deliverable = line.lstrip('- ').strip()
-                    if deliverable:
-                        deliverables.append(deliverable)
+        work_item = fields.get('work item')
         
         # Extract role from filename (format: YYYY-MM-DD_role_topic.md)
         role = None
         filename_parts = memo_path.stem.split('_')
         if len(filename_parts) >= 2:
             # Second part is typically the role
-            role = filename_parts[1]
+            role = sys.intern(filename_parts[1])
         
         return Memo(
             path=memo_path,
@@ -200,7 +364,7 @@ class MemoScanner:
             sha=sha,
             role=role,
             work_item=work_item,
-            deliverables=deliverables
+            deliverables=deliverables or []
         )
 
 
@@ -215,7 +379,7 @@ def scan_ready_to_consume(agent_sync_dir: Path) -> list[Memo]:
         List of ready-to-consume Memo objects
     """
     scanner = MemoScanner(agent_sync_dir)
-    return scanner.scan_ready_to_consume()
+    return list(scanner.scan_ready_to_consume())
 
 
 if __name__ == "__main__":
@@ -298,7 +462,7 @@ All gates passed. Ready to merge.
         
         # Scan all memos
         scanner = MemoScanner(agent_sync)
-        all_memos = scanner.scan_all()
+        all_memos = list(scanner.scan_all())
         
         print(f"\nTotal memos: {len(all_memos)}")
         for memo in all_memos:
@@ -313,20 +477,20 @@ All gates passed. Ready to merge.
                 print(f"    Deliverables: {len(memo.deliverables)}")
         
         # Scan ready-to-consume
-        ready_memos = scanner.scan_ready_to_consume()
+        ready_memos = list(scanner.scan_ready_to_consume())
         print(f"\n" + "=" * 70)
         print(f"Ready-to-consume memos: {len(ready_memos)}")
         for memo in ready_memos:
             print(f"  - {memo.path.name} (branch: {memo.branch}, sha: {memo.sha})")
         
         # Scan ready-to-merge
-        merge_memos = scanner.scan_ready_to_merge()
+        merge_memos = list(scanner.scan_ready_to_merge())
         print(f"\nReady-to-merge memos: {len(merge_memos)}")
         for memo in merge_memos:
             print(f"  - {memo.path.name} (branch: {memo.branch}, sha: {memo.sha})")
         
         # Scan blocked
-        blocked_memos = scanner.scan_blocked()
+        blocked_memos = list(scanner.scan_blocked())
         print(f"\nBlocked memos: {len(blocked_memos)}")
         for memo in blocked_memos:
             print(f"  - {memo.path.name} (work item: {memo.work_item})")
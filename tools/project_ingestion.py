@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-import json
+import os
+import re
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from heapq import nsmallest
 from pathlib import Path
 from typing import Any
 
+try:
+    from .yaml_emitter import emit_yaml
+except ImportError:
+    from yaml_emitter import emit_yaml
+
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:  # optional speedup; stdlib json is the default
+    from json import loads as _json_loads
+
 
 @dataclass(frozen=True)
 class IngestionResult:
@@ -13,6 +25,7 @@ class IngestionResult:
     profile_path: Path
     context_md: str
     context_path: Path
+    unchanged: bool = False
 
 
 def _read_text_if_exists(path: Path, limit: int = 200_000) -> str | None:
@@ -27,20 +40,57 @@ def _read_text_if_exists(path: Path, limit: int = 200_000) -> str | None:
         return None
 
 
+
+def _read_bytes_if_exists(path: Path, limit: int = 200_000) -> bytes | None:
+    try:
+        if not path.exists() or not path.is_file():
+            return None
+        with path.open("rb") as f:
+            data = f.read(limit + 1)
+        if len(data) > limit:
+            return data[:limit] + b"\n\n[TRUNCATED]\n"
+        return data
+    except Exception:
+        return None
+
+_REQ_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+def _requirement_names(text: str) -> set[str]:
+    """
+    Distinct, lower-cased package names from requirements.txt content.
+    Comments, blank lines and pip options (`-r`, `-e`, `--index-url`, ...) are skipped;
+    version specifiers, extras and environment markers are dropped.
+    """
+    names: set[str] = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in "#-":
+            continue
+        m = _REQ_NAME_RE.match(line)
+        if m:
+            names.add(m.group().lower().replace("_", "-"))
+    return names
+
+
+_FRAMEWORK_HINTS = frozenset({"next", "react", "vue", "svelte", "express", "nestjs", "fastify", "electron"})
+
+
 def _detect_from_package_json(path: Path) -> dict[str, Any]:
     out: dict[str, Any] = {"present": False}
-    raw = _read_text_if_exists(path)
+    raw = _read_bytes_if_exists(path)
     if not raw:
         return out
     try:
-        pkg = json.loads(raw)
+        pkg = _json_loads(raw)
     except Exception:
         return {"present": True, "parse_error": True}
 
-    deps = {}
+    deps: set[str] = set()
     for k in ("dependencies", "devDependencies", "peerDependencies"):
-        if isinstance(pkg.get(k), dict):
-            deps.update(pkg.get(k) or {})
+        section = pkg.get(k)
+        if isinstance(section, dict):
+            deps.update(section.keys())
 
     scripts = pkg.get("scripts") if isinstance(pkg.get("scripts"), dict) else {}
     out = {
@@ -48,14 +98,11 @@ def _detect_from_package_json(path: Path) -> dict[str, Any]:
         "name": pkg.get("name"),
         "type": pkg.get("type"),
         "scripts": scripts,
-        "deps": sorted(list(deps.keys()))[:200],  # cap for readability
+        "deps": nsmallest(200, deps),  # cap for readability
     }
 
     # Light framework hints
-    hints = []
-    for fw in ("next", "react", "vue", "svelte", "express", "nestjs", "fastify", "electron"):
-        if fw in deps:
-            hints.append(fw)
+    hints = _FRAMEWORK_HINTS & deps
     if hints:
         out["framework_hints"] = sorted(hints)
 
@@ -88,17 +135,35 @@ def build_project_profile(repo_root: Path, scope: Path | None = None) -> dict[st
         "github_workflows": ".github/workflows",
     }
 
-    signals = {k: root / v for k, v in signal_names.items()}
-
-    def _shallow_find(name: str, max_depth: int = 3) -> Path | None:
+    # One directory read answers every root-level check below.
+    try:
+        with os.scandir(root) as it:
+            root_entries = {e.name: e for e in it}
+    except OSError:
+        root_entries = {}
+
+    def _at_root(rel: str) -> bool:
+        head, _, rest = rel.partition("/")
+        entry = root_entries.get(head)
+        if entry is None:
+            return False
+        if not rest:
+            return True
+        return entry.is_dir() and (root / rel).exists()
+
+    def _shallow_find_all(max_depth: int = 3) -> dict[str, Path]:
         """
-        Find a filename or directory name within `scope` up to `max_depth` levels deep.
+        Locate every signal within `scope` up to `max_depth` levels deep, in one walk.
+        The first match in walk order wins for each signal.
         Avoid scanning orchestration artifacts and common vendor dirs.
         """
         base = scope
         ignore_dirs = {".git", "node_modules", "__pycache__", ".orchestration", "orchestration-framework", ".cursor"}
+        file_targets = {name: key for key, name in signal_names.items() if "/" not in name}
+        found: dict[str, Path] = {}
+        remaining = set(signal_names)
         try:
-            for dirpath, dirnames, filenames in __import__("os").walk(str(base)):
+            for dirpath, dirnames, filenames in os.walk(base, topdown=True):
                 p = Path(dirpath)
                 # depth relative to scope
                 try:
@@ -111,29 +176,33 @@ def build_project_profile(repo_root: Path, scope: Path | None = None) -> dict[st
                     continue
                 dirnames[:] = [d for d in dirnames if d not in ignore_dirs]
 
-                if "/" in name:
-                    # directory match (e.g. .github/workflows)
-                    target_dir = name.split("/")[0]
-                    if target_dir in dirnames and name == ".github/workflows":
-                        candidate = p / ".github" / "workflows"
-                        if candidate.exists():
-                            return candidate
-                else:
-                    if name in filenames:
-                        return p / name
+                for filename in filenames:
+                    key = file_targets.get(filename)
+                    if key in remaining:
+                        found[key] = p / filename
+                        remaining.discard(key)
+                # directory match (.github/workflows)
+                if ".github" in dirnames and "github_workflows" in remaining:
+                    candidate = p / ".github" / "workflows"
+                    if candidate.exists():
+                        found["github_workflows"] = candidate
+                        remaining.discard("github_workflows")
+                if not remaining:
+                    break
         except Exception:
-            return None
-        return None
+            pass
+        return found
 
     present: dict[str, str] = {}
-    for k, p in signals.items():
-        if p.exists():
-            present[k] = str(p.relative_to(root))
+    for k, rel in signal_names.items():
+        if _at_root(rel):
+            present[k] = str(Path(rel))
 
     # If repo-root signals are empty, do a bounded scan for nested apps.
     if not present:
-        for k, name in signal_names.items():
-            found = _shallow_find(name)
+        nested = _shallow_find_all()
+        for k in signal_names:
+            found = nested.get(k)
             if found and found.exists():
                 try:
                     present[k] = str(found.relative_to(root))
@@ -155,11 +224,11 @@ def build_project_profile(repo_root: Path, scope: Path | None = None) -> dict[st
     package_managers: list[str] = []
     if "package_json" in present:
         # lockfiles may be nested too; root check is fine for most cases
-        if (root / "pnpm-lock.yaml").exists():
+        if _at_root("pnpm-lock.yaml"):
             package_managers.append("pnpm")
-        elif (root / "yarn.lock").exists():
+        elif _at_root("yarn.lock"):
             package_managers.append("yarn")
-        elif (root / "package-lock.json").exists():
+        elif _at_root("package-lock.json"):
             package_managers.append("npm")
         else:
             package_managers.append("npm (unknown lockfile)")
@@ -192,14 +261,14 @@ def build_project_profile(repo_root: Path, scope: Path | None = None) -> dict[st
                 suggested_commands[k] = f"npm run {k}"
     # Python heuristics
     req_path = root / present["requirements_txt"] if "requirements_txt" in present else (root / "requirements.txt")
-    req = _read_text_if_exists(req_path) or ""
-    if "pytest" in req.lower():
+    req_pkgs = _requirement_names(_read_text_if_exists(req_path) or "")
+    if "pytest" in req_pkgs:
         suggested_commands.setdefault("test", "pytest")
-    if "ruff" in req.lower():
+    if "ruff" in req_pkgs:
         suggested_commands.setdefault("lint", "ruff check .")
 
     profile: dict[str, Any] = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "repo_root": str(root),
         "scope": str(scope),
         "signals_present": present,
@@ -214,6 +283,17 @@ def build_project_profile(repo_root: Path, scope: Path | None = None) -> dict[st
     return profile
 
 
+_CONTEXT_MD_FOOTER = (
+    "## Orchestration locations\n",
+    "- **Config (commit)**: `.orchestration/config/`",
+    "- **Runtime (do not commit)**: `.orchestration/runtime/`",
+    "- **Cursor agent config (commit)**: `.cursor/`\n",
+    "## Agent operating notes\n",
+    "- Prefer isolated worktrees/branches per agent when running in parallel.",
+    "- Post `ready-to-consume` memos in `.orchestration/runtime/agent-sync/` for integration.",
+)
+
+
 def build_project_context_md(profile: dict[str, Any]) -> str:
     languages = profile.get("languages") or []
     package_managers = profile.get("package_managers") or []
@@ -222,38 +302,37 @@ def build_project_context_md(profile: dict[str, Any]) -> str:
     cmds = profile.get("suggested_commands") or {}
     signals = profile.get("signals_present") or {}
 
-    lines = []
-    lines.append("# Project Context (Generated)\n")
-    lines.append("This file is generated by `/orchestrator::ingest_project`.\n")
-    lines.append("## What this repo looks like\n")
-    lines.append(f"- **Languages**: {', '.join(languages) if languages else 'unknown'}")
-    lines.append(f"- **Package managers**: {', '.join(package_managers) if package_managers else 'unknown'}")
-    lines.append(f"- **CI**: {', '.join(ci) if ci else 'none detected'}")
-    lines.append(f"- **Containerization**: {', '.join(containerization) if containerization else 'none detected'}\n")
+    lines = [
+        "# Project Context (Generated)\n",
+        "This file is generated by `/orchestrator::ingest_project`.\n",
+        "## What this repo looks like\n",
+        f"- **Languages**: {', '.join(languages) if languages else 'unknown'}",
+        f"- **Package managers**: {', '.join(package_managers) if package_managers else 'unknown'}",
+        f"- **CI**: {', '.join(ci) if ci else 'none detected'}",
+        f"- **Containerization**: {', '.join(containerization) if containerization else 'none detected'}\n",
+    ]
 
     if signals:
         lines.append("## Signal files detected\n")
-        for k, v in sorted(signals.items()):
-            lines.append(f"- **{k}**: `{v}`")
+        lines.extend([f"- **{k}**: `{v}`" for k, v in sorted(signals.items())])
         lines.append("")
 
     if cmds:
         lines.append("## Suggested commands\n")
-        for k, v in sorted(cmds.items()):
-            lines.append(f"- **{k}**: `{v}`")
+        lines.extend([f"- **{k}**: `{v}`" for k, v in sorted(cmds.items())])
         lines.append("")
 
-    lines.append("## Orchestration locations\n")
-    lines.append("- **Config (commit)**: `.orchestration/config/`")
-    lines.append("- **Runtime (do not commit)**: `.orchestration/runtime/`")
-    lines.append("- **Cursor agent config (commit)**: `.cursor/`\n")
-
-    lines.append("## Agent operating notes\n")
-    lines.append("- Prefer isolated worktrees/branches per agent when running in parallel.")
-    lines.append("- Post `ready-to-consume` memos in `.orchestration/runtime/agent-sync/` for integration.")
+    lines.extend(_CONTEXT_MD_FOOTER)
     return "\n".join(lines) + "\n"
 
 
+def _without_timestamp(profile_text: str) -> str:
+    """Profile file text minus its top-level `generated_at:` line."""
+    return "".join(
+        line for line in profile_text.splitlines(keepends=True) if not line.startswith("generated_at:")
+    )
+
+
 def ingest_project(
     repo_root: Path,
     config: dict[str, Any] | None = None,
@@ -272,12 +351,19 @@ def ingest_project(
     profile_path = config_dir / "project_profile.yaml"
     context_path = config_dir / "PROJECT_CONTEXT.md"
 
-    if not dry_run:
-        try:
-            import yaml  # type: ignore
-        except Exception as e:
-            raise RuntimeError(f"PyYAML is required to write project_profile.yaml: {e}")
-        profile_path.write_text(yaml.safe_dump(profile, sort_keys=False), encoding="utf-8")
+    # Everything but the timestamp determines the written files; skip rewriting them
+    # only when both files on disk still hold exactly what this run would write
+    # (hand edits to either one get regenerated).
+    body = emit_yaml({k: v for k, v in profile.items() if k != "generated_at"})
+    existing_profile = _read_text_if_exists(profile_path)
+    unchanged = (
+        existing_profile is not None
+        and _without_timestamp(existing_profile) == body
+        and _read_text_if_exists(context_path) == context_md
+    )
+
+    if not dry_run and not unchanged:
+        profile_path.write_text(emit_yaml(profile), encoding="utf-8")
         context_path.write_text(context_md, encoding="utf-8")
 
     return IngestionResult(
@@ -285,5 +371,6 @@ def ingest_project(
         profile_path=profile_path,
         context_md=context_md,
         context_path=context_path,
+        unchanged=unchanged,
     )
 
@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import stat
+import tempfile
 from pathlib import PurePosixPath
 import urllib.parse
 import urllib.request
 import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-TEMPLATE_VERSION = "3"
+TEMPLATE_VERSION = "4"
+
+# Pages after the first are fetched concurrently, up to this many at a time.
+_FETCH_WORKERS = 8
+# Below this many issues, work items are written serially.
+_PARALLEL_WRITE_MIN = 8
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_LINK_LAST_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+# Per-page ETags from earlier syncs, replayed as If-None-Match (a 304 costs no rate limit).
+ETAG_CACHE_PATH = Path(".orchestration") / "runtime" / "github_issues_etags.json"
+# Work items start with a small front matter block; `issue_sha` lets a sync skip
+# issues whose source fields are unchanged, even across template versions.
+_FRONT_MATTER_READ_BYTES = 512
+_ISSUE_SHA_RE = re.compile(rb"^issue_sha: ([0-9a-f]{40})\r?$", re.MULTILINE)
+_ISSUE_SHA_FIELDS = ("number", "title", "state", "html_url", "created_at", "updated_at", "labels", "assignees", "body")
+# project_profile.yaml path -> (st_mtime_ns, st_size, parsed profile)
+_PROFILE_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+# Returned by _github_request when the server answers 304 Not Modified.
+_NOT_MODIFIED = object()
 
 @dataclass(frozen=True)
 class SyncResult:
@@ -27,16 +50,25 @@ class SyncResult:
     updated: int
     skipped: int
     errors: list[str]
+    # Issues on pages answered 304 Not Modified (counted from the cached page entry,
+    # not re-fetched); not included in fetched/skipped.
+    not_modified: int = 0
 
 
 def _slugify(text: str, max_len: int = 60) -> str:
     s = (text or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
+    s = _SLUG_RE.sub("-", s).strip("-")
     if not s:
         return "issue"
     return s[:max_len].strip("-")
 
 
+def _work_item_filename(issue: dict[str, Any]) -> str:
+    number = issue.get("number")
+    slug = _slugify(issue.get("title") or "")
+    return f"GH-{number}-{slug}.md" if number else f"GH-unknown-{slug}.md"
+
+
 def _read_text(path: Path) -> str | None:
     try:
         if not path.exists():
@@ -46,24 +78,95 @@ def _read_text(path: Path) -> str | None:
         return None
 
 
-def _write_text(path: Path, content: str) -> None:
+def _read_issue_sha(path: Path) -> str | None:
+    """
+    Return the `issue_sha` recorded in a work item's front matter (bounded read), if any.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_FRONT_MATTER_READ_BYTES)
+    except OSError:
+        return None
+    if not head.startswith(b"---"):
+        return None
+    m = _ISSUE_SHA_RE.search(head)
+    return m.group(1).decode("ascii") if m else None
+
+
+def _label_names(issue: dict[str, Any]) -> list[str]:
+    return sorted([str(l["name"]) for l in issue.get("labels") or [] if isinstance(l, dict) and l.get("name")])
+
+
+def _assignee_logins(issue: dict[str, Any]) -> list[str]:
+    return sorted([str(a["login"]) for a in issue.get("assignees") or [] if isinstance(a, dict) and a.get("login")])
+
+
+def _issue_sha(issue: dict[str, Any]) -> str:
+    """
+    Content hash of the issue fields a work item is rendered from.
+    """
+    fields = {k: issue.get(k) for k in _ISSUE_SHA_FIELDS}
+    fields["labels"] = _label_names(issue)
+    fields["assignees"] = _assignee_logins(issue)
+    payload = json.dumps(fields, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def _write_text_atomic(path: Path, content: str) -> None:
+    """
+    Write a work item or the ETag cache via a unique temp file in the same directory
+    and `os.replace`, so a sync interrupted mid-write never leaves a truncated file
+    behind and concurrent syncs never share a temp file.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".gh-", suffix=".tmp")
+    try:
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
-def _github_request(url: str, token: str | None = None) -> dict[str, Any] | list[Any]:
+def _request_headers(token: str | None, etag: str | None) -> dict[str, str]:
     headers = {
         "Accept": "application/vnd.github+json",
         "User-Agent": "orchestration-framework",
     }
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    req = urllib.request.Request(url, headers=headers, method="GET")
+    if etag:
+        headers["If-None-Match"] = etag
+    return headers
+
+
+def _github_request(
+    url: str, token: str | None = None, etag: str | None = None
+) -> tuple[Any, str | None, str | None]:
+    """
+    GET a GitHub API URL and return `(json_body, link_header, etag)`.
+
+    When `etag` is given it is sent as `If-None-Match`; a 304 reply returns
+    `_NOT_MODIFIED` as the body.
+    """
+    req = urllib.request.Request(url, headers=_request_headers(token, etag), method="GET")
     try:
         with urllib.request.urlopen(req, timeout=30) as resp:  # nosec - controlled URL + read-only
-            body = resp.read().decode("utf-8", errors="replace")
-            return json.loads(body)
+            return json.loads(resp.read()), resp.headers.get("Link"), resp.headers.get("ETag")
     except urllib.error.HTTPError as e:
+        if e.code == 304 and etag:
+            return _NOT_MODIFIED, None, etag
         # Include response body for debugging (GitHub returns JSON with message + status).
         try:
             raw = e.read().decode("utf-8", errors="replace")
@@ -72,83 +175,155 @@ def _github_request(url: str, token: str | None = None) -> dict[str, Any] | list
         raise RuntimeError(f"HTTP {getattr(e, 'code', '?')} {getattr(e, 'reason', '')}: {raw}".strip()) from e
 
 
+def _load_etag_cache(path: Path) -> dict[str, Any]:
+    """
+    Load cached page entries (keyed by page URL); entries from another template version are dropped.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("template_version") != TEMPLATE_VERSION:
+        return {}
+    pages = data.get("pages")
+    return pages if isinstance(pages, dict) else {}
+
+
+def _save_etag_cache(path: Path, pages: dict[str, Any]) -> None:
+    _write_text_atomic(path, json.dumps({"template_version": TEMPLATE_VERSION, "pages": pages}, indent=2))
+
+
+def _last_page(link: str | None) -> int | None:
+    """
+    Extract the `rel="last"` page number from a GitHub `Link` header.
+    """
+    if not link:
+        return None
+    m = _LINK_LAST_RE.search(link)
+    return int(m.group(1)) if m else None
+
+
 def _issues_url(api_base: str, repo: str, state: str, per_page: int, page: int) -> str:
     owner, name = repo.split("/", 1)
     qs = urllib.parse.urlencode({"state": state, "per_page": str(per_page), "page": str(page)})
     return f"{api_base.rstrip('/')}/repos/{owner}/{name}/issues?{qs}"
 
 
-def _render_work_item(issue: dict[str, Any], repo: str) -> str:
+# Section bodies rendered when no repo-specific sections are supplied.
+_GUIDANCE_PLACEHOLDER = "- (This section is auto-filled when `AGENTS.md` / context docs exist in the repo.)\n"
+_COMMANDS_PLACEHOLDER = "- (This section is auto-filled when `.orchestration/config/project_profile.yaml` exists.)\n"
+
+_WORK_ITEM_TEMPLATE = """\
+---
+template_version: {template_version}
+updated_at: {updated_at_json}
+issue_sha: {issue_sha}
+---
+# GH-{number}: {title}
+
+- **Source**: GitHub Issues
+- **Repo**: `{repo}`
+- **Issue**: `{number}`
+- **Work Item ID**: `GH-{number}`
+- **State**: `{state}`
+{optional_meta}- **Synced At**: `{synced_at}`
+- **Template Version**: `{template_version}`
+{url_line}
+## Objective
+
+Implement this work item according to the project’s conventions.
+
+## Project Agent Guidance (detected)
+
+{guidance_block}
+## Source Issue Body
+
+{body}
+
+## Deliverables
+
+- (Fill in expected deliverables for this issue)
+
+## Suggested Commands (from ingestion)
+
+{commands_block}
+## Notes for Agents
+
+- If the issue is ambiguous, ask clarifying questions in an `agent-sync` memo.
+- When complete, commit work on your branch/worktree and post a `ready-to-consume` memo with Branch+SHA.
+"""
+
+
+def _render_work_item(
+    issue: dict[str, Any],
+    repo: str,
+    issue_sha: str | None = None,
+    sections: tuple[str, str] | None = None,
+) -> str:
+    """
+    Render a work item. `sections` (from `_template_sections`) fills the guidance and
+    commands sections directly; without it they keep their placeholders.
+    """
     number = issue.get("number")
-    title = issue.get("title") or ""
-    state = issue.get("state") or ""
     html_url = issue.get("html_url") or ""
     created_at = issue.get("created_at") or ""
     updated_at = issue.get("updated_at") or ""
-    labels = issue.get("labels") or []
-    label_names = []
-    for l in labels:
-        if isinstance(l, dict) and l.get("name"):
-            label_names.append(str(l["name"]))
-    assignees = issue.get("assignees") or []
-    assignee_logins = []
-    for a in assignees:
-        if isinstance(a, dict) and a.get("login"):
-            assignee_logins.append(str(a["login"]))
+    label_names = _label_names(issue)
+    assignee_logins = _assignee_logins(issue)
     body = issue.get("body") or ""
-    synced_at = datetime.utcnow().isoformat() + "Z"
-
-    lines = []
-    lines.append(f"# GH-{number}: {title}\n")
-    lines.append(f"- **Source**: GitHub Issues")
-    lines.append(f"- **Repo**: `{repo}`")
-    lines.append(f"- **Issue**: `{number}`")
-    lines.append(f"- **Work Item ID**: `GH-{number}`")
-    lines.append(f"- **State**: `{state}`")
+
+    guidance_block, commands_block = sections or (_GUIDANCE_PLACEHOLDER, _COMMANDS_PLACEHOLDER)
+
+    optional_meta = ""
     if label_names:
-        lines.append(f"- **Labels**: {', '.join(f'`{n}`' for n in sorted(label_names))}")
+        optional_meta += "- **Labels**: " + "`, `".join(label_names).join(("`", "`")) + "\n"
     if assignee_logins:
-        lines.append(f"- **Assignees**: {', '.join(f'`{a}`' for a in sorted(assignee_logins))}")
+        optional_meta += "- **Assignees**: " + "`, `".join(assignee_logins).join(("`", "`")) + "\n"
     if created_at:
-        lines.append(f"- **Created**: `{created_at}`")
+        optional_meta += f"- **Created**: `{created_at}`\n"
     if updated_at:
-        lines.append(f"- **Updated**: `{updated_at}`")
-    lines.append(f"- **Synced At**: `{synced_at}`")
-    lines.append(f"- **Template Version**: `{TEMPLATE_VERSION}`")
-    if html_url:
-        lines.append(f"- **URL**: `{html_url}`")
-    lines.append("")
-    lines.append("## Objective\n")
-    lines.append("Implement this work item according to the project’s conventions.\n")
-    lines.append("## Project Agent Guidance (detected)\n")
-    lines.append("- (This section is auto-filled when `AGENTS.md` / context docs exist in the repo.)\n")
-    lines.append("## Source Issue Body\n")
-    lines.append(body if body.strip() else "_(no description provided)_")
-    lines.append("")
-    lines.append("## Deliverables\n")
-    lines.append("- (Fill in expected deliverables for this issue)")
-    lines.append("")
-    lines.append("## Suggested Commands (from ingestion)\n")
-    lines.append("- (This section is auto-filled when `.orchestration/config/project_profile.yaml` exists.)\n")
-    lines.append("## Notes for Agents\n")
-    lines.append("- If the issue is ambiguous, ask clarifying questions in an `agent-sync` memo.")
-    lines.append("- When complete, commit work on your branch/worktree and post a `ready-to-consume` memo with Branch+SHA.")
-    return "\n".join(lines) + "\n"
+        optional_meta += f"- **Updated**: `{updated_at}`\n"
+
+    return _WORK_ITEM_TEMPLATE.format(
+        number=number,
+        title=issue.get("title") or "",
+        repo=repo,
+        state=issue.get("state") or "",
+        optional_meta=optional_meta,
+        synced_at=datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z",
+        template_version=TEMPLATE_VERSION,
+        updated_at_json=json.dumps(updated_at),
+        issue_sha=issue_sha or _issue_sha(issue),
+        url_line=f"- **URL**: `{html_url}`\n" if html_url else "",
+        body=body if body.strip() else "_(no description provided)_",
+        guidance_block=guidance_block,
+        commands_block=commands_block,
+    )
 
 
 def _load_project_profile(repo_root: Path) -> dict[str, Any]:
+    """
+    Load `project_profile.yaml`; parses are reused while the file's mtime and size are unchanged.
+    """
     profile_path = repo_root / ".orchestration" / "config" / "project_profile.yaml"
-    if not profile_path.exists():
+    try:
+        st = profile_path.stat()
+    except OSError:
         return {}
+    cached = _PROFILE_CACHE.get(profile_path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
     try:
         import yaml  # type: ignore
     except Exception:
         return {}
     try:
         data = yaml.safe_load(profile_path.read_text(encoding="utf-8", errors="replace")) or {}
-        return data if isinstance(data, dict) else {}
+        data = data if isinstance(data, dict) else {}
     except Exception:
         return {}
+    _PROFILE_CACHE[profile_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 def _discover_guidance_paths(repo_root: Path) -> list[str]:
@@ -164,14 +339,24 @@ def _discover_guidance_paths(repo_root: Path) -> list[str]:
         ".orchestration/runtime/agent-sync/COMMUNICATION_CONVENTIONS.md",
         ".cursor/agent.md",
     ]
-    found: list[str] = []
-    for rel in candidates:
-        if (repo_root / rel).exists():
-            found.append(rel)
+    # One directory read answers the root-level candidates and tells us which
+    # top-level dirs exist; nested candidates are only stat'ed under those.
+    try:
+        with os.scandir(repo_root) as it:
+            root_names = {e.name for e in it}
+    except OSError:
+        root_names = set()
+
+    def _present(rel: str) -> bool:
+        head, sep, _ = rel.partition("/")
+        if head not in root_names:
+            return False
+        return not sep or (repo_root / rel).exists()
+
+    found: list[str] = [rel for rel in candidates if _present(rel)]
 
     # Also add a nested AGENTS.md if it exists (common for monorepos).
-    nested = repo_root / "saasgen-consolidated" / "AGENTS.md"
-    if nested.exists():
+    if _present("saasgen-consolidated/AGENTS.md"):
         found.append("saasgen-consolidated/AGENTS.md")
 
     # Dedup preserve order
@@ -186,9 +371,10 @@ def _discover_guidance_paths(repo_root: Path) -> list[str]:
     return out
 
 
-def _fill_template_sections(repo_root: Path, content: str) -> str:
+def _template_sections(repo_root: Path) -> tuple[str, str]:
     """
-    Replace placeholder sections with repo-specific hints (best-effort).
+    Build the repo-specific guidance and suggested-commands section bodies (best-effort).
+    They depend only on the repo, so a sync computes them once for all issues.
     """
     profile = _load_project_profile(repo_root)
     guidance = _discover_guidance_paths(repo_root)
@@ -223,14 +409,24 @@ def _fill_template_sections(repo_root: Path, content: str) -> str:
     else:
         guide_lines.append("- (No guidance files detected. Add `AGENTS.md` or `.cursor/agent.md`.)")
 
+    return "\n".join(guide_lines) + "\n", "\n".join(cmd_lines) + "\n"
+
+
+def _fill_template_sections(repo_root: Path, content: str, sections: tuple[str, str] | None = None) -> str:
+    """
+    Replace placeholder sections in an already-rendered work item with repo-specific hints (best-effort).
+    The sync passes sections straight to `_render_work_item` instead.
+    """
+    guidance_block, commands_block = sections or _template_sections(repo_root)
+
     content = content.replace(
-        "## Project Agent Guidance (detected)\n\n- (This section is auto-filled when `AGENTS.md` / context docs exist in the repo.)\n",
-        "## Project Agent Guidance (detected)\n\n" + "\n".join(guide_lines) + "\n",
+        "## Project Agent Guidance (detected)\n\n" + _GUIDANCE_PLACEHOLDER,
+        "## Project Agent Guidance (detected)\n\n" + guidance_block,
     )
 
     content = content.replace(
-        "## Suggested Commands (from ingestion)\n\n- (This section is auto-filled when `.orchestration/config/project_profile.yaml` exists.)\n",
-        "## Suggested Commands (from ingestion)\n\n" + "\n".join(cmd_lines) + "\n",
+        "## Suggested Commands (from ingestion)\n\n" + _COMMANDS_PLACEHOLDER,
+        "## Suggested Commands (from ingestion)\n\n" + commands_block,
     )
 
     return content
@@ -281,73 +477,239 @@ def sync_github_issues(
 
     token = os.getenv(token_env_var)
 
-    # Fetch with pagination
-    page = 1
-    issues: list[dict[str, Any]] = []
-    while True:
+    # A cached page is only revalidated while every work item it produced still exists.
+    etag_path = repo_root / ETAG_CACHE_PATH
+    etag_pages = _load_etag_cache(etag_path)
+
+    def _cached_files(entry: dict[str, Any]) -> list[str]:
+        return [f for f, is_pr in entry.get("items") or [] if include_pull_requests or not is_pr]
+
+    def _fetch_page(page: int) -> tuple[str, Any, str | None, str | None, Exception | None]:
         url = _issues_url(api_base, repo, state, per_page, page)
+        entry = etag_pages.get(url)
+        etag = None
+        if isinstance(entry, dict) and all((dest_dir / f).exists() for f in _cached_files(entry)):
+            etag = entry.get("etag")
         try:
-            data = _github_request(url, token=token)
+            data, link, new_etag = _github_request(url, token=token, etag=etag)
         except Exception as e:
-            hint = ""
-            msg = str(e)
-            # GitHub uses 404 to hide private repos from unauthenticated callers.
-            if ("HTTP 404" in msg) and (not token):
-                hint = f" (hint: repo may be private; set {token_env_var} with access)"
-            errors.append(f"fetch failed: {e}{hint}")
-            break
-        if not isinstance(data, list):
-            errors.append("unexpected response (not a list)")
-            break
-        if not data:
-            break
-        for item in data:
-            if not isinstance(item, dict):
-                continue
-            if (not include_pull_requests) and ("pull_request" in item):
-                continue
-            issues.append(item)
-            if len(issues) >= max_issues:
+            return url, None, None, None, e
+        return url, data, link, new_etag, None
+
+    # Fetch with pagination: page 1 first, then the remaining pages we need (bounded by
+    # the Link header's rel="last") concurrently. Pages are consumed in order.
+    # The worker threads live for the whole loop rather than one pool per round.
+    executor: ThreadPoolExecutor | None = None
+    issues: list[dict[str, Any]] = []
+    not_modified = 0
+    last_page: int | None = None
+    batch = [1]
+    done = False
+    try:
+        while batch and not done:
+            if len(batch) == 1:
+                results = [_fetch_page(batch[0])]
+            else:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=_FETCH_WORKERS)
+                results = list(executor.map(_fetch_page, batch))
+
+            page_full = False
+            for url, data, link, etag, exc in results:
+                if exc is not None:
+                    hint = ""
+                    msg = str(exc)
+                    # GitHub uses 404 to hide private repos from unauthenticated callers.
+                    if ("HTTP 404" in msg) and (not token):
+                        hint = f" (hint: repo may be private; set {token_env_var} with access)"
+                    errors.append(f"fetch failed: {exc}{hint}")
+                    done = True
+                    break
+                if data is _NOT_MODIFIED:
+                    # Unchanged since the last sync: its work items are already on disk.
+                    # The page counts its recorded items, as a 200 reply would have,
+                    # so the pages requested don't depend on which ones were cached.
+                    entry = etag_pages[url]
+                    last_page = _last_page(entry.get("link")) or last_page
+                    page_full = int(entry.get("size") or 0) >= per_page
+                    not_modified += len(_cached_files(entry))
+                    if len(issues) + not_modified >= max_issues:
+                        done = True
+                        break
+                    continue
+                if not isinstance(data, list):
+                    errors.append("unexpected response (not a list)")
+                    done = True
+                    break
+                if not data:
+                    done = True
+                    break
+                last_page = _last_page(link) or last_page
+                page_full = len(data) >= per_page
+                if etag:
+                    etag_pages[url] = {
+                        "etag": etag,
+                        "link": link,
+                        "size": len(data),
+                        "items": [
+                            [_work_item_filename(item), "pull_request" in item] for item in data if isinstance(item, dict)
+                        ],
+                    }
+                else:
+                    etag_pages.pop(url, None)
+                for item in data:
+                    if not isinstance(item, dict):
+                        continue
+                    if (not include_pull_requests) and ("pull_request" in item):
+                        continue
+                    issues.append(item)
+                    if len(issues) + not_modified >= max_issues:
+                        break
+                if len(issues) + not_modified >= max_issues:
+                    done = True
+                    break
+            if done:
                 break
-        if len(issues) >= max_issues:
-            break
-        page += 1
+
+            next_page = batch[-1] + 1
+            if last_page is None:
+                # No Link header: only a full page can have a successor.
+                batch = [next_page] if page_full else []
+            else:
+                # Pull requests are filtered out client-side, so re-check the shortfall each round.
+                wanted = -(-(max_issues - len(issues) - not_modified) // per_page)
+                batch = list(range(next_page, min(last_page, next_page + wanted - 1) + 1))
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     fetched = len(issues)
 
     # Write work items
     dest_dir.mkdir(parents=True, exist_ok=True)
-    for issue in issues:
-        number = issue.get("number")
-        title = issue.get("title") or ""
-        updated_at = issue.get("updated_at") or ""
-        slug = _slugify(title)
-        fname = f"GH-{number}-{slug}.md" if number else f"GH-unknown-{slug}.md"
-        path = dest_dir / fname
+    sections = _template_sections(repo_root) if issues else None
 
-        content = _fill_template_sections(repo_root, _render_work_item(issue, repo))
+    def _process_one(issue: dict[str, Any]) -> str:
+        path = dest_dir / _work_item_filename(issue)
+
+        # Fast skip (bounded read, no rendering) if the source issue is unchanged.
+        issue_sha = _issue_sha(issue)
+        if _read_issue_sha(path) == issue_sha:
+            return "skipped"
 
         existing = _read_text(path)
+        content = _render_work_item(issue, repo, issue_sha, sections)
+
         if existing is None:
-            _write_text(path, content)
-            written += 1
-            continue
+            _write_text_atomic(path, content)
+            return "written"
+        if existing != content:
+            _write_text_atomic(path, content)
+            return "updated"
+        return "skipped"
 
-        # Fast skip if already has this updated_at marker.
-        if updated_at and (f"- **Updated**: `{updated_at}`" in existing) and (f"- **Template Version**: `{TEMPLATE_VERSION}`" in existing):
-            skipped += 1
-            continue
+    # Each issue is an independent read/render/write; overlap the file I/O across threads.
+    if len(issues) < _PARALLEL_WRITE_MIN:
+        outcomes = Counter(_process_one(issue) for issue in issues)
+    else:
+        with ThreadPoolExecutor(max_workers=min(16, len(issues))) as ex:
+            outcomes = Counter(ex.map(_process_one, issues))
+    written += outcomes["written"]
+    updated += outcomes["updated"]
+    skipped += outcomes["skipped"]
 
-        if existing != content:
-            _write_text(path, content)
-            updated += 1
-        else:
-            skipped += 1
+    try:
+        _save_etag_cache(etag_path, etag_pages)
+    except OSError as e:
+        errors.append(f"etag cache not saved: {e}")
 
     ok = len(errors) == 0
     msg = f"Synced {fetched} issue(s): {written} new, {updated} updated, {skipped} unchanged"
+    if not_modified:
+        msg += f"; {not_modified} more on not-modified pages"
     if not token:
         msg += f" (unauthenticated; set {token_env_var} to increase rate limits)"
 
-    return SyncResult(ok, msg, dry_run, repo, state, dest_dir, fetched, written, updated, skipped, errors)
+    return SyncResult(ok, msg, dry_run, repo, state, dest_dir, fetched, written, updated, skipped, errors, not_modified)
+
 
+if __name__ == "__main__":
+    # Example usage and testing: sync twice against a local fake API
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    # 150 items, every 10th a pull request: 45 issues per 50-item page
+    items = [
+        {"number": n, "title": f"Issue {n}", "state": "open", "updated_at": "2026-01-01T00:00:00Z"}
+        | ({"pull_request": {}} if n % 10 == 0 else {})
+        for n in range(1, 151)
+    ]
+    requests_seen: list[tuple[int, int]] = []  # (page, status)
+
+    class _FakeGitHub(BaseHTTPRequestHandler):
+        def log_message(self, *args: Any) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            per_page, page = int(query["per_page"][0]), int(query["page"][0])
+            body = json.dumps(items[(page - 1) * per_page : page * per_page]).encode("utf-8")
+            etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+            last = -(-len(items) // per_page)
+            if self.headers.get("If-None-Match") == etag:
+                requests_seen.append((page, 304))
+                self.send_response(304)
+                self.end_headers()
+                return
+            requests_seen.append((page, 200))
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Link", f'<{self.path.split("?")[0]}?per_page={per_page}&page={last}>; rel="last"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    os.environ["NO_PROXY"] = "127.0.0.1"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print("Testing GitHub issue sync:")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+
+        def _sync(max_issues: int) -> SyncResult:
+            requests_seen.clear()
+            res = sync_github_issues(
+                repo_root=root, repo="o/r", state="open", dest_dir=root / "work_items",
+                api_base=api_base, per_page=50, max_issues=max_issues,
+            )
+            print(f"{res.message}  pages={requests_seen}")
+            assert res.success, res.errors
+            return res
+
+        # First sync: pages 1-2 are fetched and recorded
+        res = _sync(90)
+        assert (res.fetched, res.written, res.not_modified) == (90, 90, 0)
+        assert requests_seen == [(1, 200), (2, 200)]
+
+        # Nothing changed: both pages answer 304 and count their recorded issues
+        res = _sync(90)
+        assert (res.fetched, res.skipped, res.not_modified) == (0, 0, 90)
+        assert requests_seen == [(1, 304), (2, 304)]
+
+        # A deleted work item forces its page to be fetched again; same pages requested
+        (root / "work_items" / _work_item_filename(items[55])).unlink()
+        res = _sync(90)
+        assert (res.fetched, res.written, res.skipped, res.not_modified) == (45, 1, 44, 45)
+        assert requests_seen == [(1, 304), (2, 200)]
+
+        # A lower limit stops after the first (cached) page
+        res = _sync(40)
+        assert (res.fetched, res.not_modified) == (0, 45)
+        assert requests_seen == [(1, 304)]
+
+    server.shutdown()
+    print("✓ All sync checks passed")
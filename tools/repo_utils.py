@@ -8,6 +8,8 @@ deriving a stable repo root.
 
 from __future__ import annotations
 
+import functools
+import os
 import subprocess
 from pathlib import Path
 
@@ -18,31 +20,50 @@ def find_repo_root(start: Path | None = None) -> Path:
 
     Strategy:
     0) Prefer "installed framework" markers (bootstrapped projects may not be git repos)
-    1) Try `git rev-parse --show-toplevel`
-    2) Fallback: walk parents looking for a `.git/` directory
+    1) Nearest parent with a `.git` entry (unless `GIT_DIR` redirects git elsewhere)
+    2) Try `git rev-parse --show-toplevel`
     3) Fallback: return `start` (or cwd) as-is
+
+    Results are cached per resolved start directory.
     """
     start_path = Path(start) if start else Path.cwd()
+    return _find_repo_root_cached(start_path.resolve())
+
 
+@functools.lru_cache(maxsize=32)
+def _find_repo_root_cached(current: Path) -> Path:
     # Prefer "installed framework" markers. This is important for scenarios like:
     # - running tests from within a mono-repo or nested folder that itself contains a `.git/`
     # - bootstrapped target projects that are not yet initialized as git repos
-    current = start_path.resolve()
+    nearest_git: Path | None = None
     for parent in [current, *current.parents]:
+        # One directory read per parent; nested markers are only stat'ed when their
+        # top-level entry is present. Unlistable dirs fall back to plain stats.
+        names = _entry_names(parent)
+
+        def has(name: str) -> bool:
+            return name in names if names is not None else (parent / name).exists()
+
         # Bootstrapped project root marker
-        if (parent / "orchestration-framework" / "cli.py").exists():
+        if has("orchestration-framework") and (parent / "orchestration-framework" / "cli.py").exists():
             return parent
-        if (parent / ".orchestration" / "config" / "framework.yaml").exists():
+        if has(".orchestration") and (parent / ".orchestration" / "config" / "framework.yaml").exists():
             return parent
         # Standalone framework repo marker
-        if (parent / "cli.py").exists() and (parent / "tools").exists() and (parent / "bootstrap.py").exists():
+        if has("cli.py") and has("tools") and has("bootstrap.py"):
             return parent
+        if nearest_git is None and has(".git"):
+            nearest_git = parent
+
+    # A `.git` dir (or worktree file) marks the top level; no need to spawn git.
+    if nearest_git is not None and "GIT_DIR" not in os.environ:
+        return nearest_git
 
-    # Try git plumbing first (most reliable).
+    # Ask git plumbing (handles GIT_DIR / GIT_WORK_TREE setups).
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
-            cwd=start_path,
+            cwd=current,
             check=True,
             capture_output=True,
             text=True,
@@ -53,10 +74,15 @@ def find_repo_root(start: Path | None = None) -> Path:
     except Exception:
         pass
 
-    # Fallback: detect `.git` by walking upward.
-    for parent in [current, *current.parents]:
-        if (parent / ".git").exists():
-            return parent
+    if nearest_git is not None:
+        return nearest_git
 
-    return start_path.resolve()
+    return current
 
+
+def _entry_names(directory: Path) -> set[str] | None:
+    try:
+        with os.scandir(directory) as it:
+            return {e.name for e in it}
+    except OSError:
+        return None
@@ -4,6 +4,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    from .yaml_emitter import emit_yaml
+except ImportError:
+    from yaml_emitter import emit_yaml
+
 
 @dataclass(frozen=True)
 class DerivedRolesResult:
@@ -12,9 +17,7 @@ class DerivedRolesResult:
     cursor_rule_path: Path | None
 
 
-def _has_any(haystack: list[str], needles: list[str]) -> bool:
-    s = set(haystack or [])
-    return any(n in s for n in needles)
+_FRONTEND_FRAMEWORKS = frozenset({"react", "next", "vue", "svelte"})
 
 
 def derive_roles_from_profile(profile: dict[str, Any]) -> dict[str, Any]:
@@ -25,8 +28,13 @@ def derive_roles_from_profile(profile: dict[str, Any]) -> dict[str, Any]:
     ci = profile.get("ci") or []
 
     roles: list[dict[str, Any]] = []
+    seen: set[str] = set()
 
     def add(role: str, why: str) -> None:
+        # Deduplicate by role name, preserving first rationale.
+        if role in seen:
+            return
+        seen.add(role)
         roles.append({"role": role, "why": why})
 
     # Baseline roles that are almost always useful.
@@ -35,7 +43,7 @@ def derive_roles_from_profile(profile: dict[str, Any]) -> dict[str, Any]:
     add("tech_writer", "Docs, runbooks, and user-facing guidance.")
 
     # Frontend specialization if we see typical frontend frameworks.
-    if _has_any(framework_hints, ["react", "next", "vue", "svelte"]):
+    if not _FRONTEND_FRAMEWORKS.isdisjoint(framework_hints):
         add("frontend_developer", f"UI work detected via Node framework hints: {', '.join(sorted(framework_hints))}.")
 
     # Infra/SRE specialization if we see containerization/CI.
@@ -46,22 +54,13 @@ def derive_roles_from_profile(profile: dict[str, Any]) -> dict[str, Any]:
     if languages == ["python"]:
         add("python_backend_developer", "Python-only repo detected; specialization can improve speed and correctness.")
 
-    # Deduplicate by role name, preserving first rationale.
-    seen: set[str] = set()
-    deduped: list[dict[str, Any]] = []
-    for r in roles:
-        if r["role"] in seen:
-            continue
-        seen.add(r["role"])
-        deduped.append(r)
-
     return {
         "generated_at": profile.get("generated_at"),
         "languages": languages,
         "node_framework_hints": framework_hints,
         "containerization": containerization,
         "ci": ci,
-        "recommended_roles": deduped,
+        "recommended_roles": roles,
         "notes": [
             "This is a recommendation only. Wire these roles into your workflows under `.orchestration/config/workflows/`.",
             "Keep role-specific Cursor rules small and focused; avoid duplicating large framework docs into the target repo.",
@@ -98,11 +97,7 @@ def write_derived_roles(
     cursor_rule_path: Path | None = None
 
     if not dry_run:
-        try:
-            import yaml  # type: ignore
-        except Exception as e:
-            raise RuntimeError(f"PyYAML is required to write derived_roles.yaml: {e}")
-        derived_path.write_text(yaml.safe_dump(derived, sort_keys=False), encoding="utf-8")
+        derived_path.write_text(emit_yaml(derived), encoding="utf-8")
 
         cursor_cfg = config.get("cursor") or {}
         if bool(cursor_cfg.get("enabled")):
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import heapq
+import os
+from collections import Counter
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
@@ -14,14 +17,15 @@ class StatusRenderResult:
     html_path: Path
 
 
+# Sort key for undated memos (they list last).
+_DT_MIN = datetime.min
+
+# One C-level pass instead of five chained replace() copies.
+_HTML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"})
+
+
 def _html_escape(s: str) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    return s.translate(_HTML_ESC)
 
 
 def render_status(
@@ -42,7 +46,9 @@ def render_status(
     tasks_dir = repo_root / (commands_cfg.get("task_cards_dir") or ".orchestration/runtime/agent-sync/tasks")
     status_dir = repo_root / (status_cfg.get("status_dir") or ".orchestration/runtime/status")
 
-    now = datetime.utcnow().isoformat() + "Z"
+    now = datetime.now(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+    repo_posix = repo_root.as_posix()
+    tasks_posix = tasks_dir.as_posix()
 
     # Determine which iterations to report
     iter_dirs: list[Path] = []
@@ -52,34 +58,44 @@ def render_status(
             iter_dirs = [p]
     else:
         if iterations_dir.exists():
-            iter_dirs = [p for p in sorted(iterations_dir.iterdir()) if p.is_dir()]
+            # DirEntry.is_dir() uses the type from the listing; no stat per entry.
+            with os.scandir(iterations_dir) as it:
+                names = sorted(e.name for e in it if e.is_dir())
+            iter_dirs = [iterations_dir / n for n in names]
 
     # Memo scan
     try:
-        from .memo_scanner import MemoScanner
+        from .memo_scanner import MemoScanner, MemoStatus
     except ImportError:
-        from memo_scanner import MemoScanner
-    memos = MemoScanner(agent_sync_dir).scan_all()
-
-    def _count(pred) -> int:
-        return sum(1 for m in memos if pred(m))
+        from memo_scanner import MemoScanner, MemoStatus
+    memos = list(MemoScanner(agent_sync_dir).scan_all())
 
+    # One pass: each memo's status is normalized once at parse time.
+    by_status = Counter(m.status_norm for m in memos)
     counts = {
-        "draft": _count(lambda m: m.is_draft),
-        "ready_to_consume": _count(lambda m: m.is_ready_to_consume),
-        "ready_to_merge": _count(lambda m: m.is_ready_to_merge),
-        "blocked": _count(lambda m: m.is_blocked),
+        "draft": by_status[MemoStatus.DRAFT],
+        "ready_to_consume": by_status[MemoStatus.READY_TO_CONSUME],
+        "ready_to_merge": by_status[MemoStatus.READY_TO_MERGE],
+        "blocked": by_status[MemoStatus.BLOCKED],
         "total": len(memos),
     }
 
     # Task indices
-    idx_files = sorted(tasks_dir.glob("*_INDEX.md")) if tasks_dir.exists() else []
-    latest_idx = idx_files[-1] if idx_files else None
+    # One listing both counts the indices and finds the latest; no sort needed.
+    idx_count = 0
+    latest_idx: str | None = None
+    if tasks_dir.is_dir():
+        with os.scandir(tasks_dir) as it:
+            for e in it:
+                if e.name.endswith("_INDEX.md"):
+                    idx_count += 1
+                    if latest_idx is None or e.name > latest_idx:
+                        latest_idx = e.name
 
     md = []
     md.append("# Orchestration Status\n")
     md.append(f"- **Generated at**: {now}")
-    md.append(f"- **Repo root**: `{repo_root.as_posix()}`\n")
+    md.append(f"- **Repo root**: `{repo_posix}`\n")
 
     md.append("## Memo status\n")
     md.append(f"- **total**: {counts['total']}")
@@ -97,19 +113,26 @@ def render_status(
         md.append("")
 
     md.append("## Tasks\n")
-    md.append(f"- **tasks_dir**: `{tasks_dir.as_posix()}`")
-    md.append(f"- **index_files**: {len(idx_files)}")
+    md.append(f"- **tasks_dir**: `{tasks_posix}`")
+    md.append(f"- **index_files**: {idx_count}")
     if latest_idx:
-        md.append(f"- **latest_index**: `{latest_idx.name}`")
+        md.append(f"- **latest_index**: `{latest_idx}`")
     md.append("")
 
     md.append("## Recent memos\n")
-    for m in sorted(memos, key=lambda x: (x.date or datetime.min), reverse=True)[:10]:
+    for m in heapq.nlargest(10, memos, key=lambda x: x.date or _DT_MIN):
         md.append(f"- `{m.path.name}` — `{m.status}`")
     md.append("")
 
     md_text = "\n".join(md) + "\n"
 
+    md_path = status_dir / ("STATUS.md" if not iteration else f"STATUS_{iteration}.md")
+    html_path = status_dir / ("STATUS.html" if not iteration else f"STATUS_{iteration}.html")
+
+    if dry_run:
+        # Nothing is written, so skip building and escaping the HTML page.
+        return StatusRenderResult(True, "Status rendered (dry-run)", md_path, html_path)
+
     html = f"""<!doctype html>
 <html>
 <head>
@@ -130,13 +153,8 @@ def render_status(
 </html>
 """
 
-    md_path = status_dir / ("STATUS.md" if not iteration else f"STATUS_{iteration}.md")
-    html_path = status_dir / ("STATUS.html" if not iteration else f"STATUS_{iteration}.html")
-
-    if not dry_run:
-        status_dir.mkdir(parents=True, exist_ok=True)
-        md_path.write_text(md_text, encoding="utf-8")
-        html_path.write_text(html, encoding="utf-8")
-
-    return StatusRenderResult(True, "Status rendered" + (" (dry-run)" if dry_run else ""), md_path, html_path)
+    status_dir.mkdir(parents=True, exist_ok=True)
+    md_path.write_bytes(md_text.encode("utf-8"))
+    html_path.write_bytes(html.encode("utf-8"))
 
+    return StatusRenderResult(True, "Status rendered", md_path, html_path)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import errno
+import os
 import re
 import shutil
 from dataclasses import dataclass
@@ -7,6 +9,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
+# Markdown link to a .md file, same style as `launch_agents`: ](FILENAME.md)
+_LINK_RE = re.compile(r"\]\(([^)]+\.md)\)")
+
 
 @dataclass(frozen=True)
 class ArchiveResult:
@@ -23,20 +28,13 @@ def _extract_task_files_from_index(index_text: str) -> list[str]:
     Matches the same style as `launch_agents`: ](FILENAME.md)
     """
     out: list[str] = []
-    for m in re.finditer(r"\]\(([^)]+\.md)\)", index_text):
+    for m in _LINK_RE.finditer(index_text):
         fname = m.group(1).strip()
         if fname.endswith("_INDEX.md"):
             continue
         out.append(fname)
     # preserve order but dedupe
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for f in out:
-        if f in seen:
-            continue
-        seen.add(f)
-        deduped.append(f)
-    return deduped
+    return list(dict.fromkeys(out))
 
 
 def archive_iteration_tasks(
@@ -58,14 +56,25 @@ def archive_iteration_tasks(
     if not tasks_dir.exists():
         return ArchiveResult(False, f"Tasks dir not found: {tasks_dir}")
 
+    # One listing of tasks_dir answers index discovery and card existence checks.
+    try:
+        with os.scandir(tasks_dir) as it:
+            existing = {e.name for e in it}
+    except OSError:
+        existing = set()
+
+    def _exists(p: Path) -> bool:
+        # A miss still stats, so names that differ only by case resolve as before.
+        return (p.parent == tasks_dir and p.name in existing) or p.exists()
+
     # Resolve index path (prefer caller-provided, else latest match)
     if index_path is None:
-        index_candidates = sorted(tasks_dir.glob(f"*_{iteration}_INDEX.md"))
-        if not index_candidates:
+        suffix = f"_{iteration}_INDEX.md"
+        latest_name = max((n for n in existing if n.endswith(suffix)), default=None)
+        if latest_name is None:
             return ArchiveResult(False, f"No task index found for iteration '{iteration}' in {tasks_dir}")
-        index_path = index_candidates[-1]
-
-    if not index_path.exists():
+        index_path = tasks_dir / latest_name
+    elif not index_path.exists():
         return ArchiveResult(False, f"Index not found: {index_path}")
 
     index_text = index_path.read_text(encoding="utf-8", errors="replace")
@@ -75,12 +84,13 @@ def archive_iteration_tasks(
     resolved_cards: list[Path] = []
     if card_paths is not None:
         for p in card_paths:
-            if Path(p).exists():
-                resolved_cards.append(Path(p))
+            p = Path(p)
+            if _exists(p):
+                resolved_cards.append(p)
     else:
         for fname in index_task_files:
             p = tasks_dir / fname
-            if p.exists():
+            if _exists(p):
                 resolved_cards.append(p)
 
     # Determine archive destination
@@ -94,29 +104,43 @@ def archive_iteration_tasks(
     moved: list[str] = []
     skipped: list[str] = []
 
+    # Names already taken in the archive dir: one listing, then tracked as we move.
+    used_names: set[str] = set()
+    next_suffix: dict[str, int] = {}
     if not dry_run:
         archive_root.mkdir(parents=True, exist_ok=True)
+        with os.scandir(archive_root) as it:
+            used_names = {e.name for e in it}
 
+    # Every entry was checked while resolving; a repeat of an already-moved path
+    # surfaces as FileNotFoundError below and is recorded as skipped.
     for src in to_move:
-        if not src.exists():
-            skipped.append(str(src))
-            continue
         dst = archive_root / src.name
         if dry_run:
             moved.append(f"{src} -> {dst}")
             continue
         # Avoid overwriting; if exists, suffix with incremental counter.
-        if dst.exists():
+        if dst.name in used_names:
             base = dst.stem
             ext = dst.suffix
-            i = 1
-            while True:
-                candidate = archive_root / f"{base}.{i}{ext}"
-                if not candidate.exists():
-                    dst = candidate
-                    break
+            # Resume from the last suffix handed out for this name, so repeated
+            # collisions don't re-probe 1..i each time.
+            i = next_suffix.get(dst.name, 1)
+            while f"{base}.{i}{ext}" in used_names:
                 i += 1
-        shutil.move(str(src), str(dst))
+            next_suffix[dst.name] = i + 1
+            dst = archive_root / f"{base}.{i}{ext}"
+        try:
+            # Same filesystem in the common case (archive lives under tasks_dir): a plain rename.
+            os.replace(src, dst)
+        except FileNotFoundError:
+            skipped.append(str(src))
+            continue
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
+        used_names.add(dst.name)
         moved.append(f"{src} -> {dst}")
 
     return ArchiveResult(
@@ -7,12 +7,69 @@ Generates structured task cards for agent coordination.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
 from typing import Any, Optional
 
 
+# Task card body, filled per card with str.format (one shared literal instead of a per-call f-string).
+_TASK_CARD_TEMPLATE = """# Task: {task_id}
+
+- **Role**: {role}
+- **Status**: ready-to-start
+- **Work Item**: {work_item}
+- **Priority**: {priority}
+- **Estimated Effort**: {effort}
+- **Token Budget**: {token_budget:,} tokens
+- **Dependencies**: {dependencies}
+
+## Objective
+
+{goal}
+
+## Work Item
+
+`{work_item}`
+
+## Deliverables
+
+{deliverables_md}
+
+## Steps
+
+1. Read work item file: `{work_item}`
+2. Execute all deliverables per your boot prompt
+3. Commit to your worktree branch
+4. Post ready-to-consume memo with Branch+SHA
+
+## Acceptance Criteria
+
+{criteria_md}
+
+## Resources
+
+- **Iteration Context**: See iteration CONTEXT.md for architecture, standards, examples
+- **Completion Criteria**: See iteration COMPLETION_CRITERIA.md for objective checklist
+- **Boot Prompt**: See your role-specific boot prompt in iteration directory
+
+## Command to Start
+
+```bash
+/{role}::start_task({task_id})
+```
+
+---
+
+**Status Transitions**:
+- `ready-to-start` → `in-progress` (when you begin)
+- `in-progress` → `ready-to-consume` (when complete, post memo)
+- `ready-to-consume` → `completed` (after integration)
+"""
+
+
 @dataclass
 class TaskCard:
     """Represents a task card."""
@@ -33,6 +90,9 @@ class TaskCard:
 class TaskCardGenerator:
     """Generates task cards from iteration configuration."""
     
+    # Below this many cards, write serially (pool start-up would dominate)
+    PARALLEL_WRITE_MIN = 8
+    
     def __init__(self, repo_root: Path, tasks_dir: Optional[Path] = None):
         """
         Initialize task card generator.
@@ -65,7 +125,7 @@ class TaskCardGenerator:
         if date_str is None:
             date_str = date.today().isoformat()
         
-        task_cards = []
+        cards: list[TaskCard] = []
         
         # Get agents from iteration config
         agents = iteration_config.get('agents', [])
@@ -82,7 +142,7 @@ class TaskCardGenerator:
                 task_id = f"{date_str}-{role.upper().replace('_', '-')}-{input_idx+1:02d}"
                 
                 # Create task card
-                card = TaskCard(
+                cards.append(TaskCard(
                     task_id=task_id,
                     role=role,
                     work_item=work_item,
@@ -91,17 +151,27 @@ class TaskCardGenerator:
                     effort=agent.get('effort', 'Unknown'),
                     token_budget=token_budget,
                     dependencies=dependencies
-                )
-                
-                # Write task card file
-                card_path = self._write_task_card(
-                    card,
-                    iteration_name,
-                    iteration_config.get('goal', ''),
-                    iteration_config.get('completion_criteria', {})
-                )
-                
-                task_cards.append(card_path)
+                ))
+        
+        # Write task card files. A repeated task ID maps to the same file; only
+        # its last card is written, as a serial write loop would leave it.
+        goal = iteration_config.get('goal', '')
+        # Identical for every card in the iteration; format once
+        criteria_md = self._format_criteria(iteration_config.get('completion_criteria', {}))
+        to_write = list({card.task_id: card for card in cards}.values())
+        
+        def _write(card: TaskCard) -> Path:
+            return self._write_task_card(card, iteration_name, goal, criteria_md)
+        
+        if len(to_write) < self.PARALLEL_WRITE_MIN:
+            for card in to_write:
+                _write(card)
+        else:
+            # Each card is an independent file write; overlap them on a small pool
+            with ThreadPoolExecutor(max_workers=min(32, len(to_write))) as ex:
+                list(ex.map(_write, to_write))
+        
+        task_cards = [self.tasks_dir / f"{card.task_id}.md" for card in cards]
         
         # Generate INDEX
         index_path = self._generate_index(
@@ -117,65 +187,25 @@ class TaskCardGenerator:
         card: TaskCard,
         iteration_name: str,
         goal: str,
-        completion_criteria: dict
+        criteria_md: str
     ) -> Path:
-        """Write a task card to file."""
+        """Write a task card to file (criteria_md is the pre-formatted checklist)."""
         card_path = self.tasks_dir / f"{card.task_id}.md"
         
-        content = f"""# Task: {card.task_id}
-
-- **Role**: {card.role}
-- **Status**: ready-to-start
-- **Work Item**: {card.work_item}
-- **Priority**: {card.priority}
-- **Estimated Effort**: {card.effort}
-- **Token Budget**: {card.token_budget:,} tokens
-- **Dependencies**: {', '.join(card.dependencies) if card.dependencies else 'None'}
-
-## Objective
-
-{goal}
-
-## Work Item
-
-`{card.work_item}`
-
-## Deliverables
-
-{self._format_deliverables(card.deliverables)}
-
-## Steps
-
-1. Read work item file: `{card.work_item}`
-2. Execute all deliverables per your boot prompt
-3. Commit to your worktree branch
-4. Post ready-to-consume memo with Branch+SHA
-
-## Acceptance Criteria
-
-{self._format_criteria(completion_criteria)}
-
-## Resources
-
-- **Iteration Context**: See iteration CONTEXT.md for architecture, standards, examples
-- **Completion Criteria**: See iteration COMPLETION_CRITERIA.md for objective checklist
-- **Boot Prompt**: See your role-specific boot prompt in iteration directory
-
-## Command to Start
-
-```bash
-/{card.role}::start_task({card.task_id})
-```
-
----
-
-**Status Transitions**:
-- `ready-to-start` → `in-progress` (when you begin)
-- `in-progress` → `ready-to-consume` (when complete, post memo)
-- `ready-to-consume` → `completed` (after integration)
-"""
+        content = _TASK_CARD_TEMPLATE.format(
+            task_id=card.task_id,
+            role=card.role,
+            work_item=card.work_item,
+            priority=card.priority,
+            effort=card.effort,
+            token_budget=card.token_budget,
+            dependencies=', '.join(card.dependencies) if card.dependencies else 'None',
+            goal=goal,
+            deliverables_md=self._format_deliverables(card.deliverables),
+            criteria_md=criteria_md,
+        )
         
-        card_path.write_text(content, encoding="utf-8")
+        card_path.write_bytes(content.encode("utf-8"))
         return card_path
     
     def _format_deliverables(self, deliverables: list[str]) -> str:
@@ -201,16 +231,15 @@ class TaskCardGenerator:
         """Generate task INDEX file."""
         index_path = self.tasks_dir / f"{date_str}_{iteration_name}_INDEX.md"
         
+        # Parse each task ID once; the summary, list and commands all reuse it
+        parsed = sorted(
+            (card_path, card_path.stem, self._role_from_task_id(card_path.stem))
+            for card_path in task_cards
+        )
+        
         # Group tasks by role
-        tasks_by_role: dict[str, list[Path]] = {}
-        for card_path in task_cards:
-            task_id = card_path.stem
-            # Parse role from task ID (e.g., "2026-01-10-PROD-ANALYST-01" -> "PROD-ANALYST")
-            parts = task_id.split('-')
-            role = '-'.join(parts[3:-1]) if len(parts) > 4 else 'UNKNOWN'
-            
-            if role not in tasks_by_role:
-                tasks_by_role[role] = []
+        tasks_by_role: defaultdict[str, list[Path]] = defaultdict(list)
+        for card_path, _, role in parsed:
             tasks_by_role[role].append(card_path)
         
         content = f"""# Task Index: {iteration_name}
@@ -225,14 +254,14 @@ class TaskCardGenerator:
 
 ## All Tasks
 
-{self._format_task_list(task_cards)}
+{self._format_task_list(parsed)}
 
 ## Quick Start Commands
 
 Copy these commands to start tasks:
 
 ```bash
-{self._format_start_commands(task_cards)}
+{self._format_start_commands(parsed)}
 ```
 
 ## How to Use
@@ -255,7 +284,7 @@ Copy these commands to start tasks:
 **For details on any task**, see: `agent-sync/tasks/<task-id>.md`
 """
         
-        index_path.write_text(content, encoding="utf-8")
+        index_path.write_bytes(content.encode("utf-8"))
         return index_path
     
     def _format_task_summary(self, tasks_by_role: dict[str, list[Path]]) -> str:
@@ -265,24 +294,24 @@ Copy these commands to start tasks:
             lines.append(f"- **{role}**: {len(tasks)} task(s)")
         return "\n".join(lines) if lines else "- No tasks"
     
-    def _format_task_list(self, task_cards: list[Path]) -> str:
-        """Format complete task list."""
-        lines = []
-        for card_path in sorted(task_cards):
-            task_id = card_path.stem
-            lines.append(f"- [{task_id}]({card_path.name})")
+    def _format_task_list(self, parsed: list[tuple[Path, str, str]]) -> str:
+        """Format complete task list from sorted (card_path, task_id, role) tuples."""
+        lines = [f"- [{task_id}]({card_path.name})" for card_path, task_id, _ in parsed]
         return "\n".join(lines) if lines else "- No tasks"
     
-    def _format_start_commands(self, task_cards: list[Path]) -> str:
-        """Format start commands for all tasks."""
-        lines = []
-        for card_path in sorted(task_cards):
-            task_id = card_path.stem
-            # Parse role from task ID
-            parts = task_id.split('-')
-            role = '-'.join(parts[3:-1]).lower().replace('-', '_') if len(parts) > 4 else 'unknown'
-            lines.append(f"/{role}::start_task({task_id})")
+    def _format_start_commands(self, parsed: list[tuple[Path, str, str]]) -> str:
+        """Format start commands from sorted (card_path, task_id, role) tuples."""
+        lines = [
+            f"/{role.lower().replace('-', '_')}::start_task({task_id})"
+            for _, task_id, role in parsed
+        ]
         return "\n".join(lines) if lines else "# No tasks"
+    
+    @staticmethod
+    def _role_from_task_id(task_id: str) -> str:
+        """Parse role from task ID (e.g., "2026-01-10-PROD-ANALYST-01" -> "PROD-ANALYST")."""
+        parts = task_id.split('-')
+        return '-'.join(parts[3:-1]) if len(parts) > 4 else 'UNKNOWN'
 
 
 def generate_task_cards(
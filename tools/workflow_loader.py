@@ -19,15 +19,31 @@ This module normalizes both into:
      {"id": str, "name": str|None, "iterations": [ ... ] }
   ]
 }
+plus private "_path" and "_iter_index" (lookup table for find_iteration).
 """
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Any
 
+# Normalized workflows keyed by path: (st_mtime_ns, st_size, workflow).
+_WORKFLOW_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
 
 def load_workflow_yaml(path: Path) -> dict[str, Any]:
+    """
+    Load and normalize a workflow file.
+
+    The parse is reused while the file's mtime and size are unchanged; each
+    call returns its own deep copy, so callers may modify it.
+    """
+    st = path.stat()
+    cached = _WORKFLOW_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+
     try:
         import yaml  # type: ignore
     except Exception as e:
@@ -36,7 +52,9 @@ def load_workflow_yaml(path: Path) -> dict[str, Any]:
             f"Install dependencies (e.g. `pip install -r requirements.txt`). Error: {e}"
         )
 
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    # libyaml-backed loader when PyYAML was built with it; same safe schema.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=loader) or {}
     if not isinstance(data, dict):
         raise ValueError(f"Workflow file must be a YAML mapping/object: {path}")
 
@@ -67,16 +85,35 @@ def load_workflow_yaml(path: Path) -> dict[str, Any]:
             }
         )
 
-    return {
+    # (phase id, iteration id/name) -> iteration; the first definition wins,
+    # as with a front-to-back scan.
+    iter_index: dict[tuple[str, str], dict[str, Any]] = {}
+    for phase in normalized_phases:
+        for it in phase["iterations"]:
+            if isinstance(it, dict):
+                iter_index.setdefault((phase["id"], str(it.get("id") or it.get("name"))), it)
+
+    workflow = {
         "name": name,
         "description": wf.get("description"),
         "phases": normalized_phases,
         "_path": str(path),
+        "_iter_index": iter_index,
     }
+    _WORKFLOW_CACHE[path] = (st.st_mtime_ns, st.st_size, workflow)
+    return copy.deepcopy(workflow)
 
 
 def find_iteration(workflow: dict[str, Any], phase_id: str, iteration_id: str) -> dict[str, Any]:
     """Find a specific iteration config by phase id + iteration id/name."""
+    iter_index = workflow.get("_iter_index")
+    if iter_index is not None:
+        try:
+            return iter_index[(phase_id, iteration_id)]
+        except KeyError:
+            raise KeyError(f"Iteration not found: phase={phase_id}, iteration={iteration_id}") from None
+
+    # Workflow dicts not built by load_workflow_yaml: scan.
     for p in workflow.get("phases", []):
         if str(p.get("id")) != phase_id:
             continue
@@ -7,10 +7,163 @@ Manages git worktrees for isolated agent workspaces.
 
 from __future__ import annotations
 
+import errno
+import os
+import re
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
+
+# Full object name: SHA-1 or SHA-256
+_HEX_SHA_RE = re.compile(r'[0-9a-f]{40}(?:[0-9a-f]{24})?')
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt  # type: ignore
+
+# Lock held by someone else (flock: EWOULDBLOCK/EAGAIN; msvcrt: EACCES/EDEADLOCK)
+_LOCK_BUSY_ERRNOS = frozenset({errno.EAGAIN, errno.EWOULDBLOCK, errno.EACCES, errno.EDEADLK})
+
+
+def _is_plain_name(name: str) -> bool:
+    """True if `name` is a single directory entry name (no separators, not '.'/'..')."""
+    if name in ('', '.', '..') or os.sep in name:
+        return False
+    return not (os.altsep and os.altsep in name)
+
+
+def _path_in_use(path: Path) -> bool:
+    """True if `git worktree add` would refuse `path`: it exists and is not an empty directory."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
+    except NotADirectoryError:
+        return True
+
+
+def _error_text(exc: Exception) -> str:
+    """Last line of git's stderr for a failed command (its `fatal:` message), else the exception text."""
+    stderr = getattr(exc, 'stderr', None)
+    if isinstance(stderr, bytes):
+        stderr = stderr.decode(errors='replace')
+    lines = stderr.strip().splitlines() if stderr else []
+    return lines[-1] if lines else str(exc)
+
+
+def _read_head_sha(worktree_path: Path, ref: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve a linked worktree's HEAD by reading its git files, without git.
+    
+    Follows the `.git` pointer file to the worktree's gitdir, reads `HEAD`, and
+    for a symbolic ref looks it up in the common dir (`commondir`), first as a
+    loose ref, then in `packed-refs`. Returns None when any step does not
+    match that layout (e.g. reftable refs), so callers can ask git instead.
+    With `ref`, HEAD must be exactly that symbolic ref, else None.
+    """
+    try:
+        pointer = (worktree_path / '.git').read_text(encoding='utf-8').strip()
+        if not pointer.startswith('gitdir: '):
+            return None
+        gitdir = worktree_path / pointer[len('gitdir: '):]
+        head = (gitdir / 'HEAD').read_text(encoding='utf-8').strip()
+        if ref is not None and head != 'ref: ' + ref:
+            return None
+        if not head.startswith('ref: '):
+            return head if _HEX_SHA_RE.fullmatch(head) else None
+        ref = head[len('ref: '):]
+        
+        try:
+            commondir = gitdir / (gitdir / 'commondir').read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            commondir = gitdir
+        try:
+            sha = (commondir / ref).read_text(encoding='utf-8').strip()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            sha = None
+        if sha is not None:
+            return sha if _HEX_SHA_RE.fullmatch(sha) else None
+        
+        try:
+            packed = (commondir / 'packed-refs').read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+        suffix = ' ' + ref
+        for line in packed.splitlines():
+            if line.endswith(suffix):
+                sha = line[:-len(suffix)]
+                return sha if _HEX_SHA_RE.fullmatch(sha) else None
+    except OSError:
+        return None
+    return None
+
+
+def _parse_porcelain(lines: Iterable[str]) -> list[Worktree]:
+    """
+    Parse `git worktree list --porcelain` lines (without line terminators).
+    
+    Records are blank-line separated; attribute lines are `<key> <value>`,
+    except the bare `bare` flag. Keys other than worktree/HEAD/branch are ignored.
+    Fields are gathered into parallel lists and materialized once at the end.
+    """
+    paths: list[str] = []
+    branches: list[str] = []
+    shas: list[str] = []
+    bares: list[bool] = []
+    
+    cur_path: Optional[str] = None
+    cur_branch = ''
+    cur_sha = ''
+    cur_bare = False
+    in_record = False
+    
+    for line in lines:
+        if not line:
+            if in_record:
+                paths.append(cur_path)
+                branches.append(cur_branch)
+                shas.append(cur_sha)
+                bares.append(cur_bare)
+                cur_path, cur_branch, cur_sha, cur_bare = None, '', '', False
+                in_record = False
+            continue
+        if line == 'bare':
+            cur_bare = in_record = True
+            continue
+        key, sep, value = line.partition(' ')
+        if not sep:
+            continue
+        if key == 'worktree':
+            cur_path = value
+        elif key == 'HEAD':
+            cur_sha = value
+        elif key == 'branch':
+            # Remove refs/heads/ prefix; interned so repeated listings share one string
+            cur_branch = sys.intern(value.removeprefix('refs/heads/'))
+        else:
+            continue
+        in_record = True
+    
+    # Handle last worktree
+    if in_record:
+        paths.append(cur_path)
+        branches.append(cur_branch)
+        shas.append(cur_sha)
+        bares.append(cur_bare)
+    
+    return [
+        Worktree(path=Path(p), branch=b, head_sha=sha, is_bare=bare)
+        for p, b, sha, bare in zip(paths, branches, shas, bares)
+    ]
 
 
 @dataclass
@@ -28,7 +181,17 @@ class Worktree:
 
 
 class WorktreeManager:
-    """Manages git worktrees for agent workspaces."""
+    """
+    Manages git worktrees for agent workspaces.
+    
+    Usable directly or as a context manager; the `with` form keeps one worker
+    pool across batch calls and releases helper resources on exit.
+    """
+    
+    # Seconds a worktree listing is reused while the git metadata is unchanged
+    CACHE_TTL = 0.5
+    # Seconds to wait for another manager's add/remove/prune before giving up
+    LOCK_TIMEOUT = 300.0
     
     def __init__(self, repo_root: Path, worktree_base: Optional[Path] = None):
         """
@@ -44,60 +207,76 @@ class WorktreeManager:
             self.worktree_base = self.repo_root.parent / f"{self.repo_root.name}.worktrees"
         else:
             self.worktree_base = Path(worktree_base)
+        
+        # Last listing: (monotonic time, git metadata key, worktrees, worktrees by branch)
+        self._cache: Optional[tuple[float, tuple, list[Worktree], dict[str, Worktree]]] = None
+        # Last scan of worktree_base: (monotonic time, {(role, task_name), ...})
+        self._base_cache: Optional[tuple[float, set[tuple[str, str]]]] = None
+        # Git common dir (holds the mutation lock file), resolved on first use
+        self._common_dir: Optional[Path] = None
+        # Worker pool for batch operations, kept only inside a `with` block
+        self._in_context = False
+        self._executor: Optional[ThreadPoolExecutor] = None
     
-    def list_worktrees(self) -> list[Worktree]:
+    def list_worktrees(self, refresh: bool = False) -> list[Worktree]:
         """
         List all git worktrees.
         
+        A listing is reused for up to CACHE_TTL seconds while `.git` and
+        `.git/worktrees` are unchanged; this manager's own create/remove/prune
+        calls drop it as soon as their git command returns.
+        
+        Args:
+            refresh: Ignore any cached listing
+            
         Returns:
             List of Worktree objects
         """
-        result = subprocess.run(
-            ['git', 'worktree', 'list', '--porcelain'],
-            cwd=self.repo_root,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        worktrees = []
-        current = {}
-        
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if not line:
-                if current:
-                    worktrees.append(Worktree(
-                        path=Path(current['worktree']),
-                        branch=current.get('branch', ''),
-                        head_sha=current.get('HEAD', ''),
-                        is_bare=current.get('bare', False)
-                    ))
-                    current = {}
-                continue
-            
-            if line.startswith('worktree '):
-                current['worktree'] = line.split(' ', 1)[1]
-            elif line.startswith('HEAD '):
-                current['HEAD'] = line.split(' ', 1)[1]
-            elif line.startswith('branch '):
-                branch = line.split(' ', 1)[1]
-                # Remove refs/heads/ prefix
-                if branch.startswith('refs/heads/'):
-                    branch = branch[len('refs/heads/'):]
-                current['branch'] = branch
-            elif line == 'bare':
-                current['bare'] = True
-        
-        # Handle last worktree
-        if current:
-            worktrees.append(Worktree(
-                path=Path(current['worktree']),
-                branch=current.get('branch', ''),
-                head_sha=current.get('HEAD', ''),
-                is_bare=current.get('bare', False)
-            ))
+        return list(self._snapshot(refresh)[2])
+    
+    def _snapshot(self, refresh: bool = False) -> tuple[float, tuple, list[Worktree], dict[str, Worktree]]:
+        """Return the cached listing and its branch index, re-listing when stale."""
+        key = self._metadata_key()
+        now = time.monotonic()
+        cached = self._cache
+        if not refresh and cached and cached[1] == key and now - cached[0] < self.CACHE_TTL:
+            return cached
         
+        worktrees = self._list_worktrees_git()
+        # First worktree per branch wins, as a front-to-back scan would find it
+        by_branch: dict[str, Worktree] = {}
+        for worktree in worktrees:
+            by_branch.setdefault(worktree.branch, worktree)
+        self._cache = (now, key, worktrees, by_branch)
+        return self._cache
+    
+    def _metadata_key(self) -> tuple:
+        """mtimes of `.git` and `.git/worktrees`; adding or removing a worktree changes them."""
+        git_path = self.repo_root / '.git'
+        key = []
+        for p in (git_path, git_path / 'worktrees'):
+            try:
+                key.append(p.stat().st_mtime_ns)
+            except OSError:
+                key.append(None)
+        return tuple(key)
+    
+    def _list_worktrees_git(self) -> list[Worktree]:
+        """List worktrees by parsing `git worktree list --porcelain`."""
+        cmd = ['git', 'worktree', 'list', '--porcelain']
+        # Parse lines as git writes them rather than buffering the whole output
+        with subprocess.Popen(
+            cmd,
+            cwd=self.repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        ) as proc:
+            worktrees = _parse_porcelain(line.rstrip('\n') for line in proc.stdout)
+            stderr = proc.stderr.read()
+            returncode = proc.wait()
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
         return worktrees
     
     def create_worktree(
@@ -119,37 +298,205 @@ class WorktreeManager:
         Returns:
             Created Worktree object
         """
-        # Create branch name
-        branch_name = f"{branch_prefix}/{role}/{task_name}"
+        with self._repo_lock():
+            worktree_path, branch_name = self._add_worktree(role, task_name, base_branch, branch_prefix)
         
-        # Create worktree path
-        worktree_path = self.worktree_base / role / task_name
-        worktree_path.parent.mkdir(parents=True, exist_ok=True)
+        return Worktree(
+            path=worktree_path,
+            branch=branch_name,
+            head_sha=self._head_sha(worktree_path),
+            is_bare=False
+        )
+    
+    def create_worktrees_batch(
+        self,
+        specs: list[tuple[str, str, str, str]],
+        skip_existing: bool = False,
+        errors: Optional[list[str]] = None
+    ) -> list[Worktree]:
+        """
+        Create several agent worktrees under one repo lock.
         
-        # Create worktree
-        subprocess.run(
-            ['git', 'worktree', 'add', '-b', branch_name, str(worktree_path), base_branch],
+        The `git worktree add` calls run one at a time: each writes the new
+        branch into `.git/config`, and concurrent adds fail on its lock file.
+        HEADs are then resolved on a thread pool, as in create_worktree.
+        
+        Args:
+            specs: (role, task_name, base_branch, branch_prefix) per worktree
+            skip_existing: Leave out worktrees whose branch already exists or
+                whose path is taken, without running git for them
+            errors: If given, a failed add is appended here as
+                "<branch>: <git error>" and the batch goes on; otherwise it raises
+            
+        Returns:
+            Created Worktree objects, in `specs` order
+        """
+        if not specs:
+            return []
+        
+        added: list[tuple[Path, str]] = []
+        # One lock for the whole batch, so other managers and processes can't
+        # interleave their own adds or prunes with it
+        with self._repo_lock():
+            branches = self._branch_names() if skip_existing else set()
+            for role, task_name, base_branch, branch_prefix in specs:
+                worktree_path, branch_name = self._worktree_target(role, task_name, branch_prefix)
+                if skip_existing and (branch_name in branches or _path_in_use(worktree_path)):
+                    continue
+                try:
+                    added.append(self._add_worktree(role, task_name, base_branch, branch_prefix))
+                except (subprocess.CalledProcessError, OSError) as e:
+                    if errors is None:
+                        raise
+                    errors.append(f"{branch_name}: {_error_text(e)}")
+        if not added:
+            return []
+        
+        def _resolve(target: tuple[Path, str]) -> Worktree:
+            worktree_path, branch_name = target
+            return Worktree(
+                path=worktree_path,
+                branch=branch_name,
+                head_sha=self._head_sha(worktree_path),
+                is_bare=False
+            )
+        
+        if self._in_context:
+            # Reuse one bounded pool across batches for the life of the block
+            return list(self._shared_executor().map(_resolve, added))
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(added))) as ex:
+            return list(ex.map(_resolve, added))
+    
+    @contextmanager
+    def _repo_lock(self):
+        """
+        Hold an exclusive lock on `<git common dir>/orchestrator-worktrees.lock`.
+        
+        Serializes `git worktree add/remove/prune` across managers, threads and
+        processes so concurrent orchestrators do not race on `.git/config.lock`
+        or the `.git/worktrees` admin directory. Waits up to LOCK_TIMEOUT
+        seconds, then raises TimeoutError.
+        """
+        lock_path = self._git_common_dir() / 'orchestrator-worktrees.lock'
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            deadline = time.monotonic() + self.LOCK_TIMEOUT
+            while True:
+                try:
+                    if fcntl is not None:
+                        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    else:
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError as e:
+                    if e.errno not in _LOCK_BUSY_ERRNOS:
+                        raise
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"Timed out waiting for worktree lock: {lock_path}") from None
+                    time.sleep(0.05)
+            try:
+                yield
+            finally:
+                if fcntl is None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)  # also releases the flock
+    
+    def _git_common_dir(self) -> Path:
+        """The git dir shared by all worktrees of repo_root (honours GIT_COMMON_DIR); looked up once."""
+        if self._common_dir is None:
+            result = subprocess.run(
+                ['git', 'rev-parse', '--git-common-dir'],
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            # Relative output is relative to repo_root
+            self._common_dir = self.repo_root / result.stdout.strip()
+        return self._common_dir
+    
+    def _branch_names(self) -> set[str]:
+        """Names of all local branches, from one `git for-each-ref`."""
+        result = subprocess.run(
+            ['git', 'for-each-ref', '--format=%(refname)', 'refs/heads/'],
             cwd=self.repo_root,
-            check=True,
-            capture_output=True
+            capture_output=True,
+            text=True,
+            check=True
         )
-        
-        # Get HEAD SHA
+        return {ref.removeprefix('refs/heads/') for ref in result.stdout.splitlines()}
+    
+    def _shared_executor(self) -> ThreadPoolExecutor:
+        """The manager's worker pool (cpu_count threads), started on first use; close() stops it."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self._executor
+    
+    def _head_sha(self, worktree_path: Path) -> str:
+        """HEAD SHA of a linked worktree, read from its git files; `git rev-parse` if that fails."""
+        head_sha = _read_head_sha(worktree_path)
+        if head_sha is not None:
+            return head_sha
         result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=worktree_path,
+            ['git', '-C', str(worktree_path), 'rev-parse', 'HEAD'],
+            cwd=self.repo_root,
             capture_output=True,
             text=True,
             check=True
         )
-        head_sha = result.stdout.strip()
+        return result.stdout.strip()
+    
+    def close(self) -> None:
+        """Shut down the batch pool and drop the cached listing."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._cache = None
+    
+    def __enter__(self) -> WorktreeManager:
+        self._in_context = True
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._in_context = False
+        self.close()
+    
+    def _add_worktree(
+        self,
+        role: str,
+        task_name: str,
+        base_branch: str,
+        branch_prefix: str
+    ) -> tuple[Path, str]:
+        """Run `git worktree add` for a new agent branch; returns (path, branch)."""
+        worktree_path, branch_name = self._worktree_target(role, task_name, branch_prefix)
+        # Usually worktree_base exists: one mkdir of the role dir, no ancestor walk
+        try:
+            os.mkdir(worktree_path.parent)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            worktree_path.parent.mkdir(parents=True, exist_ok=True)
         
-        return Worktree(
-            path=worktree_path,
-            branch=branch_name,
-            head_sha=head_sha,
-            is_bare=False
-        )
+        # Create worktree
+        try:
+            subprocess.run(
+                ['git', 'worktree', 'add', '-b', branch_name, str(worktree_path), base_branch],
+                cwd=self.repo_root,
+                check=True,
+                capture_output=True
+            )
+        finally:
+            # Dropped once git is done (callers hold the repo lock), so a
+            # concurrent listing can't re-cache the pre-add state
+            self._invalidate_caches()
+        return worktree_path, branch_name
+    
+    def _worktree_target(self, role: str, task_name: str, branch_prefix: str) -> tuple[Path, str]:
+        """(path, branch) of the agent worktree for `role` and `task_name`."""
+        return self.worktree_base / role / task_name, f"{branch_prefix}/{role}/{task_name}"
     
     def remove_worktree(self, worktree_path: Path, force: bool = False) -> None:
         """
@@ -163,15 +510,28 @@ class WorktreeManager:
         if force:
             cmd.append('--force')
         
-        subprocess.run(cmd, cwd=self.repo_root, check=True)
+        with self._repo_lock():
+            try:
+                subprocess.run(cmd, cwd=self.repo_root, check=True)
+            finally:
+                self._invalidate_caches()
     
     def prune_worktrees(self) -> None:
         """Remove worktree administrative files for deleted worktrees."""
-        subprocess.run(
-            ['git', 'worktree', 'prune'],
-            cwd=self.repo_root,
-            check=True
-        )
+        with self._repo_lock():
+            try:
+                subprocess.run(
+                    ['git', 'worktree', 'prune'],
+                    cwd=self.repo_root,
+                    check=True
+                )
+            finally:
+                self._invalidate_caches()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop the cached listing and worktree_base scan after a mutation."""
+        self._cache = None
+        self._base_cache = None
     
     def get_worktree(self, branch: str) -> Optional[Worktree]:
         """
@@ -183,10 +543,35 @@ class WorktreeManager:
         Returns:
             Worktree object if found, None otherwise
         """
-        for worktree in self.list_worktrees():
-            if worktree.branch == branch:
+        # Branches made here are `{prefix}/{role}/{task}`, checked out at
+        # worktree_base/role/task: read that worktree's files before listing all
+        parts = branch.split('/', 2)
+        if len(parts) == 3 and all(parts):
+            worktree = self._probe_worktree(self.worktree_base / parts[1] / parts[2], branch)
+            if worktree is not None:
                 return worktree
-        return None
+        return self._snapshot()[3].get(branch)
+    
+    @staticmethod
+    def _probe_worktree(worktree_path: Path, branch: str) -> Optional[Worktree]:
+        """
+        Worktree at `worktree_path` if it is a linked worktree on `branch`, else None.
+        
+        The path is the one git recorded in the admin entry's `gitdir` file (as
+        `git worktree list` reports it), which must point back at this directory.
+        """
+        head_sha = _read_head_sha(worktree_path, ref=f"refs/heads/{branch}")
+        if head_sha is None:
+            return None
+        try:
+            pointer = (worktree_path / '.git').read_text(encoding='utf-8').strip()
+            gitdir = worktree_path / pointer[len('gitdir: '):]
+            recorded = Path((gitdir / 'gitdir').read_text(encoding='utf-8').strip()).parent
+            if not os.path.samefile(recorded, worktree_path):
+                return None
+        except OSError:
+            return None
+        return Worktree(path=recorded, branch=branch, head_sha=head_sha, is_bare=False)
     
     def worktree_exists(self, role: str, task_name: str) -> bool:
         """
@@ -199,8 +584,37 @@ class WorktreeManager:
         Returns:
             True if worktree exists
         """
-        worktree_path = self.worktree_base / role / task_name
-        return worktree_path.exists()
+        if not (_is_plain_name(role) and _is_plain_name(task_name)):
+            # Nested or relative components: not answerable from a two-level scan
+            return (self.worktree_base / role / task_name).exists()
+        return (role, task_name) in self._scan_worktree_base()
+    
+    def _scan_worktree_base(self) -> set[tuple[str, str]]:
+        """
+        (role, task_name) pairs present under worktree_base, two levels deep.
+        
+        One scandir per role directory instead of a stat per probe; reused for
+        CACHE_TTL seconds and dropped by this manager's create/remove calls.
+        """
+        now = time.monotonic()
+        cached = self._base_cache
+        if cached and now - cached[0] < self.CACHE_TTL:
+            return cached[1]
+        
+        pairs: set[tuple[str, str]] = set()
+        try:
+            with os.scandir(self.worktree_base) as roles:
+                role_dirs = [e for e in roles if e.is_dir()]
+        except OSError:
+            role_dirs = []
+        for role_entry in role_dirs:
+            try:
+                with os.scandir(role_entry.path) as tasks:
+                    pairs.update((role_entry.name, e.name) for e in tasks)
+            except OSError:
+                continue
+        self._base_cache = (now, pairs)
+        return pairs
 
 
 def create_agent_worktree(
@@ -297,9 +711,42 @@ if __name__ == "__main__":
             print(f"Found worktree by branch: {wt.path}")
         print()
         
+        # Create several worktrees at once; an existing one is skipped
+        print("Creating worktrees in a batch...")
+        batch = manager.create_worktrees_batch(
+            [
+                ('qa_engineer', 'US-E03-030', 'main', 'feat'),
+                ('product_analyst', 'US-E01-010', 'main', 'feat'),
+                ('tech_writer', 'US-E04-040', 'main', 'feat'),
+            ],
+            skip_existing=True
+        )
+        assert [w.branch for w in batch] == ['feat/qa_engineer/US-E03-030', 'feat/tech_writer/US-E04-040']
+        assert all(w.head_sha == wt1.head_sha for w in batch)
+        listed = {w.branch for w in manager.list_worktrees()}
+        assert {w.branch for w in batch} <= listed
+        print(f"✓ Created {len(batch)} worktrees, skipped 1 existing")
+        
+        # Other failures are reported, not skipped, and the batch goes on
+        errors: list[str] = []
+        batch += manager.create_worktrees_batch(
+            [
+                ('devops', 'US-E05-050', 'no-such-branch', 'feat'),
+                ('devops', 'US-E05-051', 'main', 'feat'),
+            ],
+            skip_existing=True,
+            errors=errors
+        )
+        assert len(errors) == 1 and errors[0].startswith('feat/devops/US-E05-050: '), errors
+        assert batch[-1].branch == 'feat/devops/US-E05-051'
+        print(f"✓ Reported 1 failed add: {errors[0]}")
+        print()
+        
         # Clean up
         print("Cleaning up worktrees...")
         manager.remove_worktree(wt1.path)
         manager.remove_worktree(wt2.path)
+        for w in batch:
+            manager.remove_worktree(w.path)
         manager.prune_worktrees()
         print("✓ Cleanup complete")
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+# Strings that YAML reads back verbatim without quoting (no bool/null/number lookalikes).
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z/][A-Za-z0-9_./@+-]*(?: [A-Za-z0-9_./@+-]+)*")
+_YAML_RESERVED = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+_YAML_ESCAPE_RE = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
+
+
+def _yaml_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return ".nan"
+        if value in (float("inf"), float("-inf")):
+            return ".inf" if value > 0 else "-.inf"
+        text = repr(value)
+        # YAML 1.1 floats need a dot in the mantissa: 1e+20 -> 1.0e+20
+        if "." not in text:
+            mantissa, _, exponent = text.partition("e")
+            text = f"{mantissa}.0e{exponent}"
+        return text
+    if not isinstance(value, str):
+        raise TypeError(f"unsupported value for YAML output: {type(value).__name__}")
+    if _YAML_PLAIN_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+        return value
+    # A JSON string is a valid YAML double-quoted scalar once non-printables and line breaks are escaped.
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _YAML_ESCAPE_RE.sub(lambda m: "\\u%04x" % ord(m.group()), quoted)
+
+
+def _emit_mapping(data: dict[str, Any], indent: int, lines: list[str]) -> None:
+    pad = " " * indent
+    for key, value in data.items():
+        k = _yaml_scalar(str(key))
+        if isinstance(value, dict) and value:
+            lines.append(f"{pad}{k}:")
+            _emit_mapping(value, indent + 2, lines)
+        elif isinstance(value, list) and value:
+            lines.append(f"{pad}{k}:")
+            _emit_sequence(value, indent, lines)
+        elif isinstance(value, dict):
+            lines.append(f"{pad}{k}: {{}}")
+        elif isinstance(value, list):
+            lines.append(f"{pad}{k}: []")
+        else:
+            lines.append(f"{pad}{k}: {_yaml_scalar(value)}")
+
+
+def _emit_sequence(items: list[Any], indent: int, lines: list[str]) -> None:
+    pad = " " * indent
+    for item in items:
+        if isinstance(item, dict) and item:
+            # Emit the mapping one level in, then hang its first key off the dash.
+            start = len(lines)
+            _emit_mapping(item, indent + 2, lines)
+            lines[start] = f"{pad}- {lines[start][indent + 2:]}"
+        elif isinstance(item, list) and item:
+            # Same for a nested list: its first item shares the line with this dash.
+            start = len(lines)
+            _emit_sequence(item, indent + 2, lines)
+            lines[start] = f"{pad}- {lines[start][indent + 2:]}"
+        elif isinstance(item, dict):
+            lines.append(f"{pad}- {{}}")
+        elif isinstance(item, list):
+            lines.append(f"{pad}- []")
+        else:
+            lines.append(f"{pad}- {_yaml_scalar(item)}")
+
+
+def emit_yaml(data: dict[str, Any]) -> str:
+    """
+    Serialize generated config (project profile, derived roles) as block-style YAML.
+
+    Supports the shapes those files use, and anything `json.loads` returns:
+    scalars (including floats), nested mappings, and lists of scalars,
+    mappings or lists. This avoids importing PyYAML and running its
+    representer/emitter; output loads back with `yaml.safe_load` to the same dict.
+    """
+    lines: list[str] = []
+    _emit_mapping(data, 0, lines)
+    return "\n".join(lines) + "\n"